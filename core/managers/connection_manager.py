@@ -2,9 +2,10 @@
 连接配置管理器 - 负责加载和保存数据库连接配置
 
 使用方法:
-    from core.managers.connection_manager import ConnectionManager
+    from core.managers.connection_manager import ConnectionManager, get_connection_manager
     
     manager = ConnectionManager()
+    # 或使用各插件共享的实例: manager = get_connection_manager()
     profiles = manager.load_profiles()
     manager.save_profile("prod_mysql", "192.168.1.100", 3306, "admin", "password", "mysql")
 
@@ -26,6 +27,7 @@
 """
 
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -112,9 +114,27 @@ class ConnectionManager:
         self._profiles: List[Dict[str, Any]] = []
         self._config: Dict[str, Any] = {"version": "1.0", "profiles": []}
         
+        # 缓存对应的配置文件修改时间（None 表示需要重新读取）
+        self._loaded_mtime: Optional[int] = None
+        
+        # 实例在各插件及后台线程间共享，读写缓存时加锁（可重入：import_from_dict 会调用 save_profile）
+        self._lock = threading.RLock()
+        
         # 加载现有配置
         self._load_config()
     
+    def _config_mtime(self) -> Optional[int]:
+        """获取配置文件修改时间（纳秒），文件不存在时返回 None"""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _reload_if_changed(self) -> None:
+        """配置文件在缓存后被修改（如其他窗口保存了配置）时重新加载"""
+        if self._loaded_mtime is None or self._config_mtime() != self._loaded_mtime:
+            self._load_config()
+    
     def _load_config(self) -> None:
         """从文件加载配置"""
         if not self.config_file.exists():
@@ -123,10 +143,12 @@ class ConnectionManager:
             return
         
         try:
+            mtime = self._config_mtime()
             with open(self.config_file, "r", encoding="utf-8") as f:
                 self._config = json.load(f)
             
             self._profiles = self._config.get("profiles", [])
+            self._loaded_mtime = mtime
             
         except json.JSONDecodeError as e:
             print(f"[Warning] 配置文件格式错误: {e}，将创建新配置")
@@ -152,6 +174,8 @@ class ConnectionManager:
             with open(self.config_file, "w", encoding="utf-8") as f:
                 json.dump(self._config, f, ensure_ascii=False, indent=2)
             
+            # 内存中的数据即为文件内容，无需再次读取
+            self._loaded_mtime = self._config_mtime()
             return True
             
         except Exception as e:
@@ -163,11 +187,13 @@ class ConnectionManager:
         加载所有连接配置
         
         Returns:
-            连接配置列表
+            连接配置列表（副本）
         """
-        # 重新加载以获取最新数据
-        self._load_config()
-        return self._profiles.copy()
+        with self._lock:
+            # 配置文件未变化时直接使用缓存
+            self._reload_if_changed()
+            # 逐个复制，调用方修改返回的配置不会污染缓存
+            return [dict(p) for p in self._profiles]
     
     def get_profile(self, name_or_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -179,10 +205,11 @@ class ConnectionManager:
         Returns:
             配置字典，未找到返回 None
         """
-        for profile in self._profiles:
-            if profile.get("name") == name_or_id or profile.get("id") == name_or_id:
-                return profile.copy()
-        return None
+        with self._lock:
+            for profile in self._profiles:
+                if profile.get("name") == name_or_id or profile.get("id") == name_or_id:
+                    return profile.copy()
+            return None
     
     def save_profile(
         self,
@@ -229,44 +256,45 @@ class ConnectionManager:
         
         now = datetime.now().isoformat()
         
-        # 检查是否已存在同名配置
-        existing_idx = None
-        for idx, profile in enumerate(self._profiles):
-            if profile.get("name") == name:
-                existing_idx = idx
-                break
-            if profile_id and profile.get("id") == profile_id:
-                existing_idx = idx
-                break
-        
-        new_profile = {
-            "id": profile_id or str(uuid.uuid4())[:8],
-            "name": name,
-            "host": host,
-            "port": port,
-            "username": username,
-            "password": password,  # TODO: 生产环境应加密存储
-            "db_type": db_type,
-            "database": database,
-            "updated_at": now,
-            # Phase 7 新增字段
-            "auth_source": auth_source,
-            "oracle_mode": oracle_mode,
-            "oracle_value": oracle_value
-        }
-        
-        if existing_idx is not None:
-            # 更新现有配置，保留创建时间
-            new_profile["created_at"] = self._profiles[existing_idx].get("created_at", now)
-            self._profiles[existing_idx] = new_profile
-            print(f"[Info] 更新连接配置: {name}")
-        else:
-            # 创建新配置
-            new_profile["created_at"] = now
-            self._profiles.append(new_profile)
-            print(f"[Info] 新建连接配置: {name}")
-        
-        return self._save_to_file()
+        with self._lock:
+            # 检查是否已存在同名配置
+            existing_idx = None
+            for idx, profile in enumerate(self._profiles):
+                if profile.get("name") == name:
+                    existing_idx = idx
+                    break
+                if profile_id and profile.get("id") == profile_id:
+                    existing_idx = idx
+                    break
+            
+            new_profile = {
+                "id": profile_id or str(uuid.uuid4())[:8],
+                "name": name,
+                "host": host,
+                "port": port,
+                "username": username,
+                "password": password,  # TODO: 生产环境应加密存储
+                "db_type": db_type,
+                "database": database,
+                "updated_at": now,
+                # Phase 7 新增字段
+                "auth_source": auth_source,
+                "oracle_mode": oracle_mode,
+                "oracle_value": oracle_value
+            }
+            
+            if existing_idx is not None:
+                # 更新现有配置，保留创建时间
+                new_profile["created_at"] = self._profiles[existing_idx].get("created_at", now)
+                self._profiles[existing_idx] = new_profile
+                print(f"[Info] 更新连接配置: {name}")
+            else:
+                # 创建新配置
+                new_profile["created_at"] = now
+                self._profiles.append(new_profile)
+                print(f"[Info] 新建连接配置: {name}")
+            
+            return self._save_to_file()
     
     def delete_profile(self, name_or_id: str) -> bool:
         """
@@ -278,17 +306,18 @@ class ConnectionManager:
         Returns:
             是否删除成功
         """
-        original_len = len(self._profiles)
-        self._profiles = [
-            p for p in self._profiles 
-            if p.get("name") != name_or_id and p.get("id") != name_or_id
-        ]
-        
-        if len(self._profiles) < original_len:
-            print(f"[Info] 删除连接配置: {name_or_id}")
-            return self._save_to_file()
-        
-        return False
+        with self._lock:
+            original_len = len(self._profiles)
+            self._profiles = [
+                p for p in self._profiles 
+                if p.get("name") != name_or_id and p.get("id") != name_or_id
+            ]
+            
+            if len(self._profiles) < original_len:
+                print(f"[Info] 删除连接配置: {name_or_id}")
+                return self._save_to_file()
+            
+            return False
     
     def get_profile_names(self) -> List[str]:
         """
@@ -297,8 +326,9 @@ class ConnectionManager:
         Returns:
             配置名称列表
         """
-        self._load_config()  # 确保获取最新数据
-        return [p.get("name", "未命名") for p in self._profiles]
+        with self._lock:
+            self._reload_if_changed()  # 确保获取最新数据
+            return [p.get("name", "未命名") for p in self._profiles]
     
     def export_to_dict(self, include_passwords: bool = False) -> Dict[str, Any]:
         """
@@ -310,18 +340,19 @@ class ConnectionManager:
         Returns:
             配置字典
         """
-        export_config = self._config.copy()
-        
-        if not include_passwords:
-            # 移除密码字段
-            export_profiles = []
-            for profile in export_config.get("profiles", []):
-                profile_copy = profile.copy()
-                profile_copy.pop("password", None)
-                export_profiles.append(profile_copy)
-            export_config["profiles"] = export_profiles
-        
-        return export_config
+        with self._lock:
+            export_config = self._config.copy()
+            
+            if not include_passwords:
+                # 移除密码字段
+                export_profiles = []
+                for profile in export_config.get("profiles", []):
+                    profile_copy = profile.copy()
+                    profile_copy.pop("password", None)
+                    export_profiles.append(profile_copy)
+                export_config["profiles"] = export_profiles
+            
+            return export_config
     
     def import_from_dict(self, config_dict: Dict[str, Any], merge: bool = False) -> int:
         """
@@ -336,23 +367,45 @@ class ConnectionManager:
         """
         imported_profiles = config_dict.get("profiles", [])
         
-        if not merge:
-            self._profiles = []
-        
-        count = 0
-        for profile in imported_profiles:
-            # 生成新 ID 避免冲突
-            profile["id"] = None  # 让 save_profile 生成新 ID
-            success = self.save_profile(
-                name=profile.get("name", "未命名"),
-                host=profile.get("host", "localhost"),
-                port=profile.get("port", 3306),
-                username=profile.get("username", ""),
-                password=profile.get("password", ""),
-                db_type=profile.get("db_type", "mysql"),
-                database=profile.get("database", "")
-            )
-            if success:
-                count += 1
-        
-        return count
+        with self._lock:
+            if not merge:
+                self._profiles = []
+            
+            count = 0
+            for profile in imported_profiles:
+                # 生成新 ID 避免冲突
+                profile["id"] = None  # 让 save_profile 生成新 ID
+                success = self.save_profile(
+                    name=profile.get("name", "未命名"),
+                    host=profile.get("host", "localhost"),
+                    port=profile.get("port", 3306),
+                    username=profile.get("username", ""),
+                    password=profile.get("password", ""),
+                    db_type=profile.get("db_type", "mysql"),
+                    database=profile.get("database", "")
+                )
+                if success:
+                    count += 1
+            
+            return count
+
+
+# 进程内共享的连接管理器（首次使用时创建）
+_CONNECTION_MANAGER: Optional[ConnectionManager] = None
+_CONNECTION_MANAGER_LOCK = threading.Lock()
+
+
+def get_connection_manager() -> ConnectionManager:
+    """
+    获取共享的连接管理器
+    
+    各插件共用同一个实例，配置缓存只需读取和维护一份
+    
+    Returns:
+        使用默认配置文件的 ConnectionManager
+    """
+    global _CONNECTION_MANAGER
+    with _CONNECTION_MANAGER_LOCK:
+        if _CONNECTION_MANAGER is None:
+            _CONNECTION_MANAGER = ConnectionManager()
+    return _CONNECTION_MANAGER
@@ -4,7 +4,7 @@ Oracle 数据泵工作线程 - 执行 expdp/impdp 命令
 功能：
 - 构建并执行 expdp/impdp 命令
 - 实时捕获输出日志
-- 密码脱敏显示
+- 凭据通过临时参数文件 (PARFILE) 传递，不出现在命令行
 - 客户端环境检查
 
 依赖:
@@ -12,10 +12,14 @@ Oracle 数据泵工作线程 - 执行 expdp/impdp 命令
     - expdp/impdp 命令在 PATH 中
 """
 
+import codecs
+import os
 import subprocess
 import sys
 import shutil
-from typing import Any, Dict, List, Optional
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from PySide6.QtCore import QThread, Signal
@@ -29,16 +33,22 @@ class DataPumpWorker(QThread):
     - 支持 expdp (导出) 和 impdp (导入)
     - Easy Connect String 连接
     - 实时输出捕获
-    - 密码脱敏日志
+    - 凭据写入临时 PARFILE，ps 和日志中均不含密码
     
     信号:
-        output_signal: 实时输出日志 (line_text)
+        output_signal: 实时输出日志 (lines_text，多行以 \n 分隔)
         finished_signal: 执行完成 (exit_code, success)
         error_signal: 错误信息 (error_msg)
     """
     
+    # 每次从管道读取的最大字节数
+    READ_CHUNK_SIZE = 65536
+    
+    # stop() 发送 SIGTERM 后等待进程退出的秒数，超时则 kill
+    STOP_GRACE_PERIOD = 3
+    
     # 信号定义
-    output_signal = Signal(str)      # 实时输出行
+    output_signal = Signal(str)      # 实时输出（一批行，以 \n 分隔）
     finished_signal = Signal(int, bool)  # (退出码, 是否成功)
     error_signal = Signal(str)       # 错误信息
     
@@ -49,6 +59,7 @@ class DataPumpWorker(QThread):
         dmp_filename: str,
         directory_name: str = "DATA_PUMP_DIR",
         additional_params: Optional[List[str]] = None,
+        parallel: int = 1,
         parent=None
     ):
         """
@@ -65,6 +76,8 @@ class DataPumpWorker(QThread):
             dmp_filename: DMP 文件名 (不含路径)
             directory_name: Oracle 目录对象名，默认 DATA_PUMP_DIR
             additional_params: 额外参数列表
+            parallel: 并行度，0 表示自动 (CPU 核数的一半)；
+                大于 1 时导出文件名自动使用 %U 模板，需要 Oracle 企业版
             parent: 父对象
         """
         super().__init__(parent)
@@ -74,6 +87,7 @@ class DataPumpWorker(QThread):
         self.dmp_filename = dmp_filename
         self.directory_name = directory_name
         self.additional_params = additional_params or []
+        self.parallel = parallel if parallel > 0 else max(1, (os.cpu_count() or 1) // 2)
         
         self._is_running = False
         self._process: Optional[subprocess.Popen] = None
@@ -85,14 +99,14 @@ class DataPumpWorker(QThread):
     def run(self) -> None:
         """执行数据泵命令"""
         self._is_running = True
+        parfile = None
         
         try:
-            # 构建命令
-            cmd_parts = self._build_command()
+            # 凭据写入临时参数文件，命令行本身不含密码，可直接显示
+            parfile = self._write_parfile()
+            cmd_parts = self._build_command(parfile)
             
-            # 发送脱敏后的命令信息
-            masked_cmd = self._mask_password_in_cmd(cmd_parts)
-            self.output_signal.emit(f"执行命令: {masked_cmd}")
+            self.output_signal.emit(f"执行命令: {' '.join(cmd_parts)}")
             self.output_signal.emit("-" * 60)
             
             # Windows 下隐藏控制台窗口
@@ -109,39 +123,35 @@ class DataPumpWorker(QThread):
                 stderr=subprocess.STDOUT,
                 stdin=subprocess.PIPE,
                 startupinfo=startupinfo,
-                bufsize=1,
+                bufsize=65536,  # 二进制模式下 bufsize=1 等于无缓冲，逐字节 read()
                 universal_newlines=False
             )
             
-            # 实时读取输出
-            while self._is_running and self._process.poll() is None:
-                line = self._process.stdout.readline()
-                if line:
-                    # 解码输出
-                    try:
-                        decoded_line = line.decode('gbk', errors='replace')
-                    except:
-                        decoded_line = line.decode('utf-8', errors='replace')
-                    
-                    decoded_line = decoded_line.rstrip('\r\n')
-                    if decoded_line:
-                        self.output_signal.emit(decoded_line)
+            # 实时读取输出：read1 阻塞到有数据为止，返回当前管道中已有的全部字节；
+            # 同一次读取到的多行合并为一次 output_signal 发送，减少跨线程事件和界面刷新
+            decoder = codecs.getincrementaldecoder('gbk')(errors='replace')
+            pending = ""
+            while self._is_running:
+                chunk = self._process.stdout.read1(self.READ_CHUNK_SIZE)
+                if not chunk:
+                    break  # EOF（进程退出或被 stop 终止）
                 
-                self.msleep(50)  # 短暂休眠避免 CPU 过高
+                lines = (pending + decoder.decode(chunk)).split('\n')
+                pending = lines.pop()  # 末尾不完整的行留待下次拼接
+                self._emit_lines(lines)
             
-            # 读取剩余输出
-            remaining = self._process.stdout.read()
-            if remaining:
-                try:
-                    decoded = remaining.decode('gbk', errors='replace')
-                except:
-                    decoded = remaining.decode('utf-8', errors='replace')
-                
-                for line in decoded.strip().split('\n'):
-                    if line.strip():
-                        self.output_signal.emit(line.rstrip('\r\n'))
+            # 输出最后一行（无换行结尾）
+            self._emit_lines([pending + decoder.decode(b'', final=True)])
             
-            # 获取退出码
+            # 获取退出码：被 stop() 终止时在工作线程里等待宽限期，仍未退出则强杀
+            if self._is_running:
+                self._process.wait()
+            else:
+                try:
+                    self._process.wait(timeout=self.STOP_GRACE_PERIOD)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
             exit_code = self._process.returncode
             success = exit_code == 0
             
@@ -168,13 +178,29 @@ class DataPumpWorker(QThread):
         finally:
             self._is_running = False
             self._process = None
+            if parfile:
+                try:
+                    os.remove(parfile)
+                except OSError:
+                    pass
     
-    def _build_command(self) -> List[str]:
+    def _emit_lines(self, lines: List[str]) -> None:
         """
-        构建数据泵命令
+        批量发送输出行（跳过空行）
+        
+        Args:
+            lines: 已解码的输出行
+        """
+        batch = [line.rstrip('\r') for line in lines if line.strip('\r')]
+        if batch:
+            self.output_signal.emit('\n'.join(batch))
+    
+    def _write_parfile(self) -> str:
+        """
+        将连接凭据写入临时参数文件（仅当前用户可读，run 结束后删除）
         
         Returns:
-            命令参数列表
+            参数文件路径
         """
         # 提取配置
         username = self.db_config.get("username", "")
@@ -183,81 +209,54 @@ class DataPumpWorker(QThread):
         port = self.db_config.get("port", 1521)
         service_name = self.db_config.get("service_name") or self.db_config.get("database", "ORCL")
         
-        # 构建 Easy Connect String
-        # 格式: user/password@//host:port/service_name
-        conn_str = f"{username}/{password}@//{host}:{port}/{service_name}"
-        
-        # 构建命令
-        if self.operation == "expdp":
-            # 导出命令
-            cmd = [
-                "expdp",
-                conn_str,
-                f"directory={self.directory_name}",
-                f"dumpfile={self.dmp_filename}",
-                f"logfile={self.dmp_filename}.log",
-            ]
-            
-            # 默认添加 full=y (全库导出)
-            if "full" not in " ".join(self.additional_params):
-                cmd.append("full=y")
-                
-        else:  # impdp
-            # 导入命令
-            cmd = [
-                "impdp",
-                conn_str,
-                f"directory={self.directory_name}",
-                f"dumpfile={self.dmp_filename}",
-                f"logfile={self.dmp_filename}.imp.log",
-            ]
-            
-            # 默认添加 full=y 和 table_exists_action
-            if "full" not in " ".join(self.additional_params):
-                cmd.append("full=y")
-            if "table_exists_action" not in " ".join(self.additional_params):
-                cmd.append("table_exists_action=replace")
-        
-        # 添加额外参数
-        cmd.extend(self.additional_params)
-        
-        return cmd
+        fd, path = tempfile.mkstemp(suffix='.par')
+        try:
+            os.chmod(path, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                # Easy Connect String 格式: user/password@//host:port/service_name
+                f.write(f"userid={username}/{password}@//{host}:{port}/{service_name}\n")
+        except Exception:
+            os.remove(path)
+            raise
+        return path
     
-    def _mask_password_in_cmd(self, cmd_parts: List[str]) -> str:
+    def _build_command(self, parfile: str) -> List[str]:
         """
-        将命令中的密码脱敏显示
+        构建数据泵命令
         
         Args:
-            cmd_parts: 命令参数列表
-            
+            parfile: 包含 userid 的参数文件路径
+        
         Returns:
-            脱敏后的命令字符串
+            命令参数列表
         """
-        username = self.db_config.get("username", "")
-        password = self.db_config.get("password", "")
-        
-        # 重建命令字符串并脱敏
-        cmd_str = " ".join(cmd_parts)
+        # 额外参数的键名集合（如 "full=y" -> "full"），用于判断是否需要补默认值
+        existing_keys = {p.split('=', 1)[0].strip().lower() for p in self.additional_params}
         
-        # 替换密码部分
-        # 格式: username/password@//host...
-        if password:
-            pwd_pattern = f"{username}/{password}@"
-            masked_pwd = f"{username}/******@"
-            cmd_str = cmd_str.replace(pwd_pattern, masked_pwd)
+        # 默认全库导出/导入，impdp 默认覆盖已存在的表
+        extras = []
+        if "full" not in existing_keys:
+            extras.append("full=y")
+        if self.operation == "impdp" and "table_exists_action" not in existing_keys:
+            extras.append("table_exists_action=replace")
+        extras.extend(self.additional_params)
         
-        return cmd_str
+        parallel = 1 if "parallel" in existing_keys else self.parallel
+        return _build_datapump_argv(
+            self.operation, f"parfile={parfile}", self.directory_name,
+            self.dmp_filename, extras, parallel
+        )
     
     def stop(self) -> None:
-        """停止执行"""
+        """停止执行（只发送终止信号并立即返回，回收进程由 run() 完成）"""
         self._is_running = False
         
-        if self._process and self._process.poll() is None:
+        process = self._process
+        if process and process.poll() is None:
             try:
-                self._process.terminate()
-                self._process.wait(timeout=3)
-            except:
-                self._process.kill()
+                process.terminate()
+            except OSError:
+                pass  # 进程已退出
     
     def is_running(self) -> bool:
         """检查是否正在运行"""
@@ -271,9 +270,8 @@ class DataPumpWorker(QThread):
         Returns:
             (是否可用, 错误信息)
         """
-        # 检查 expdp 和 impdp 是否可用
-        expdp_available = shutil.which("expdp") is not None
-        impdp_available = shutil.which("impdp") is not None
+        # 检查 expdp 和 impdp 是否可用（结果缓存，PATH 变更后调用 clear_oracle_client_cache 刷新）
+        expdp_available, impdp_available = _which_datapump_tools()
         
         if not expdp_available and not impdp_available:
             return False, "未检测到 Oracle 客户端 (expdp/impdp 命令未找到)\n请安装 Oracle Instant Client 并配置 PATH 环境变量"
@@ -287,6 +285,93 @@ class DataPumpWorker(QThread):
         return True, "Oracle 客户端检测正常"
 
 
+def _parallel_dumpfile(dumpfile: str) -> str:
+    """
+    将 DMP 文件名转换为并行导出的 %U 模板（export.dmp -> export_%U.dmp）
+    
+    Args:
+        dumpfile: DMP 文件名
+        
+    Returns:
+        带 %U 通配符的文件名，已包含 %U 时原样返回
+    """
+    if "%u" in dumpfile.lower():
+        return dumpfile
+    stem, dot, ext = dumpfile.rpartition(".")
+    if not dot:
+        return f"{dumpfile}_%U"
+    return f"{stem}_%U.{ext}"
+
+
+@lru_cache(maxsize=64)
+def _datapump_base_argv(operation: str, directory: str, dumpfile: str, parallel: int) -> Tuple[str, ...]:
+    """
+    生成与连接无关的固定参数（directory/dumpfile/logfile/parallel），按参数组合缓存
+    
+    Args:
+        operation: 'expdp' 或 'impdp'
+        directory: Oracle 目录对象名
+        dumpfile: DMP 文件名
+        parallel: 并行度
+        
+    Returns:
+        参数元组
+    """
+    if operation == "expdp":
+        # 并行导出时每个 worker 写各自的 %U 文件
+        target = _parallel_dumpfile(dumpfile) if parallel > 1 else dumpfile
+        logfile = f"{dumpfile}.log"
+    else:
+        target = dumpfile
+        logfile = f"{dumpfile}.imp.log"
+    
+    base = (f"directory={directory}", f"dumpfile={target}", f"logfile={logfile}")
+    if parallel > 1:
+        base += (f"parallel={parallel}",)
+    return base
+
+
+def _build_datapump_argv(
+    operation: str,
+    conn_arg: str,
+    directory: str,
+    dumpfile: str,
+    extras: List[str],
+    parallel: int = 1
+) -> List[str]:
+    """
+    构建 expdp/impdp 命令参数列表（DataPumpWorker 与 DataPumpCommandBuilder 共用）
+    
+    Args:
+        operation: 'expdp' 或 'impdp'
+        conn_arg: 连接参数（Easy Connect String 或 parfile=...），固定位于第 2 个元素
+        directory: Oracle 目录对象名
+        dumpfile: DMP 文件名
+        extras: 追加在末尾的参数
+        parallel: 并行度
+        
+    Returns:
+        命令参数列表
+    """
+    return [operation, conn_arg, *_datapump_base_argv(operation, directory, dumpfile, parallel), *extras]
+
+
+@lru_cache(maxsize=1)
+def _which_datapump_tools() -> Tuple[bool, bool]:
+    """
+    在 PATH 中查找 expdp/impdp（会 stat 大量目录，结果缓存）
+    
+    Returns:
+        (expdp 是否可用, impdp 是否可用)
+    """
+    return shutil.which("expdp") is not None, shutil.which("impdp") is not None
+
+
+def clear_oracle_client_cache() -> None:
+    """清除 Oracle 客户端检测缓存（PATH 变更后调用）"""
+    _which_datapump_tools.cache_clear()
+
+
 class DataPumpCommandBuilder:
     """
     数据泵命令构建器
@@ -329,25 +414,15 @@ class DataPumpCommandBuilder:
         """
         conn_str = f"{username}/{password}@//{host}:{port}/{service_name}"
         
-        cmd = [
-            "expdp",
-            conn_str,
-            f"directory={directory}",
-            f"dumpfile={dumpfile}",
-            f"logfile={dumpfile}.log",
-        ]
-        
+        extras = []
         if full:
-            cmd.append("full=y")
+            extras.append("full=y")
         elif schemas:
-            cmd.append(f"schemas={','.join(schemas)}")
+            extras.append(f"schemas={','.join(schemas)}")
         elif tables:
-            cmd.append(f"tables={','.join(tables)}")
-        
-        if parallel > 1:
-            cmd.append(f"parallel={parallel}")
+            extras.append(f"tables={','.join(tables)}")
         
-        return cmd
+        return _build_datapump_argv("expdp", conn_str, directory, dumpfile, extras, parallel)
     
     @staticmethod
     def build_impdp_command(
@@ -386,25 +461,17 @@ class DataPumpCommandBuilder:
         """
         conn_str = f"{username}/{password}@//{host}:{port}/{service_name}"
         
-        cmd = [
-            "impdp",
-            conn_str,
-            f"directory={directory}",
-            f"dumpfile={dumpfile}",
-            f"logfile={dumpfile}.imp.log",
-        ]
-        
+        extras = []
         if full:
-            cmd.append("full=y")
+            extras.append("full=y")
         elif schemas:
-            cmd.append(f"schemas={','.join(schemas)}")
+            extras.append(f"schemas={','.join(schemas)}")
         elif tables:
-            cmd.append(f"tables={','.join(tables)}")
+            extras.append(f"tables={','.join(tables)}")
         
-        cmd.append(f"table_exists_action={table_exists_action}")
+        extras.append(f"table_exists_action={table_exists_action}")
         
         if remap_schema:
-            for source, target in remap_schema.items():
-                cmd.append(f"remap_schema={source}:{target}")
+            extras.extend(f"remap_schema={source}:{target}" for source, target in remap_schema.items())
         
-        return cmd
+        return _build_datapump_argv("impdp", conn_str, directory, dumpfile, extras)
@@ -3,11 +3,301 @@
 
 依赖:
     pip install sqlalchemy pymysql oracledb pymssql
+    
+    # 可选：加速 MongoDB 结果的 JSON 序列化
+    pip install orjson
 """
 
+import atexit
+import json
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from time import monotonic
 from typing import Any, Dict, List, Optional, Tuple, Union
 from PySide6.QtCore import QThread, Signal
 
+# 数据库驱动在模块加载时导入一次，缺失时在执行对应类型的操作时报错
+try:
+    from sqlalchemy import create_engine, text
+    _HAS_SA = True
+except ImportError:
+    _HAS_SA = False
+
+try:
+    from pymongo import MongoClient
+    from pymongo.errors import ConnectionFailure, OperationFailure
+    _HAS_PYMONGO = True
+except ImportError:
+    _HAS_PYMONGO = False
+
+# orjson 为可选依赖（C 实现，序列化大文档更快），未安装时使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 通用错误规则 (_ERROR_MESSAGES 的键, 小写关键字)，按优先级排列，命中第一条即返回
+_GENERIC_ERROR_RULES = (
+    ("timeout", ("timeout",)),
+    ("auth", ("access denied", "login failed")),
+    ("unreachable", ("unknown host", "could not connect")),
+    ("no_database", ("unknown database", "database does not exist")),
+)
+
+# 各数据库特有错误规则（同样按优先级排列）
+_MYSQL_ERROR_RULES = (
+    ("syntax", ("syntax",)),
+    ("perf_schema", ("performance_schema",)),
+)
+_DB_ERROR_RULES = {
+    "mysql": _MYSQL_ERROR_RULES,
+    "mariadb": _MYSQL_ERROR_RULES,
+    "sqlserver": (("invalid_object", ("invalid object name",)),),
+}
+
+_ERROR_MESSAGES = {
+    "timeout": "连接超时（{timeout}秒），请检查网络或增加超时时间",
+    "auth": "认证失败：用户名或密码错误",
+    "unreachable": "无法连接到数据库服务器，请检查主机地址和端口",
+    "no_database": "数据库不存在，请检查数据库名称",
+    "syntax": "SQL 语法错误：\n{original}",
+    "perf_schema": "Performance Schema 未启用，某些查询无法执行",
+    "invalid_object": "对象不存在，请检查表名或视图名",
+}
+
+# Oracle 错误码 -> 友好信息（按优先级排列）
+_ORA_CODE_RE = re.compile(r"ORA-(\d{5})", re.IGNORECASE)
+_ORA_CODES = {
+    "00942": "表或视图不存在，或当前用户无权限访问",
+    "01031": "权限不足，需要 DBA 权限才能执行此操作",
+    "01555": "快照过旧，查询时间太长或 UNDO 表空间不足",
+    "00054": "资源正忙，对象被其他会话锁定",
+}
+
+# 单元格显示的最大字符数，超出部分截断为 "..."
+MAX_CELL_LENGTH = 1000
+
+
+def _stringify_rows(rows) -> List[List[str]]:
+    """
+    将结果行转换为字符串矩阵（None 显示为空，过长字符串截断）
+    
+    使用嵌套推导式，避免逐单元格的 append 方法调用。
+    
+    Args:
+        rows: DBAPI 结果行
+        
+    Returns:
+        二维字符串列表
+    """
+    limit = MAX_CELL_LENGTH
+    return [
+        [
+            "" if v is None else (s if len(s := str(v)) <= limit else s[:limit - 3] + "...")
+            for v in row
+        ]
+        for row in rows
+    ]
+
+
+# 已创建的 SQLAlchemy 引擎，按 (连接字符串, 超时) 复用，最近最少使用的先淘汰
+_ENGINES: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+_ENGINES_LOCK = threading.Lock()
+
+# 缓存的引擎数量上限
+MAX_CACHED_ENGINES = 16
+
+
+def _get_engine(connection_string: str, timeout: int):
+    """
+    获取 SQLAlchemy 引擎（按连接字符串和超时缓存）
+    
+    超出上限时淘汰最久未用的引擎并释放其连接池。
+    
+    Args:
+        connection_string: SQLAlchemy 连接字符串
+        timeout: 连接超时（秒）
+        
+    Returns:
+        Engine 对象
+    """
+    key = (connection_string, timeout)
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(key)
+        if engine is not None:
+            _ENGINES.move_to_end(key)
+            return engine
+        
+        engine = create_engine(
+            connection_string,
+            connect_args={"connect_timeout": timeout},
+            pool_pre_ping=True,
+            echo=False
+        )
+        _ENGINES[key] = engine
+        if len(_ENGINES) <= MAX_CACHED_ENGINES:
+            return engine
+        _, evicted = _ENGINES.popitem(last=False)
+    
+    evicted.dispose()
+    return engine
+
+
+@atexit.register
+def dispose_engines() -> None:
+    """释放所有缓存引擎的连接池（进程退出时自动调用）"""
+    with _ENGINES_LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
+def _match_error_rule(error_str: str, rules) -> Optional[str]:
+    """
+    按顺序匹配错误规则
+    
+    Args:
+        error_str: 小写的错误信息
+        rules: (键, 关键字元组) 序列
+        
+    Returns:
+        第一条命中规则的键，均未命中时返回 None
+    """
+    for key, keywords in rules:
+        if any(keyword in error_str for keyword in keywords):
+            return key
+    return None
+
+
+@lru_cache(maxsize=512)
+def _text_clause(sql: str):
+    """
+    获取 SQL 对应的 TextClause（按 SQL 文本缓存）
+    
+    同一 TextClause 对象重复执行时可命中 SQLAlchemy 的语句编译缓存。
+    
+    Args:
+        sql: SQL 语句
+        
+    Returns:
+        TextClause 对象
+    """
+    return text(sql)
+
+
+def _json_loads(data: str) -> Any:
+    """解析 JSON（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """
+    格式化输出 JSON（缩进 2 空格，无法序列化的值转为字符串）
+    
+    优先使用 orjson；遇到 orjson 不支持的值（如超出 64 位的整数）时回退到标准库。
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+# 已创建的 MongoClient，按 (主机, 端口, 用户名, 密码, 认证库, 超时) 复用，最近最少使用的先淘汰
+_MONGO_CLIENTS: "OrderedDict[Tuple, Any]" = OrderedDict()
+_MONGO_CLIENTS_LOCK = threading.Lock()
+
+# 缓存的 MongoClient 数量上限（每个客户端带有后台监控线程）
+MAX_CACHED_MONGO_CLIENTS = 8
+
+# MongoDB 认证失败的错误码
+_MONGO_AUTH_FAILED = 18
+
+
+def _get_mongo_client(
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    auth_source: str,
+    timeout_ms: int
+):
+    """
+    获取 MongoClient（按连接参数缓存）
+    
+    MongoClient 自带连接池和监控线程，创建成本高，应在进程内复用。
+    连接参数以关键字传入，无需拼接和解析 URI，密码中的 @ : / 等字符也无需转义。
+    超出上限时关闭最久未用的客户端。
+    
+    Args:
+        host: 主机地址
+        port: 端口号
+        username: 用户名（为空时不认证）
+        password: 密码
+        auth_source: 认证数据库
+        timeout_ms: 服务器选择超时（毫秒）
+        
+    Returns:
+        MongoClient 对象
+    """
+    key = (host, port, username, password, auth_source, timeout_ms)
+    with _MONGO_CLIENTS_LOCK:
+        client = _MONGO_CLIENTS.get(key)
+        if client is not None:
+            _MONGO_CLIENTS.move_to_end(key)
+            return client
+        
+        # 构造时不连接服务器，可在锁内完成
+        credentials = {}
+        if username and password:
+            credentials = {"username": username, "password": password, "authSource": auth_source}
+        client = MongoClient(host=host, port=int(port), serverSelectionTimeoutMS=timeout_ms, **credentials)
+        _MONGO_CLIENTS[key] = client
+        if len(_MONGO_CLIENTS) <= MAX_CACHED_MONGO_CLIENTS:
+            return client
+        _, evicted = _MONGO_CLIENTS.popitem(last=False)
+    
+    evicted.close()
+    return client
+
+
+def _discard_mongo_client(client) -> None:
+    """
+    移除并关闭连接或认证失败的 MongoClient（如密码输错），避免其监控线程一直驻留
+    
+    Args:
+        client: _get_mongo_client 返回的客户端
+    """
+    with _MONGO_CLIENTS_LOCK:
+        for key, cached in _MONGO_CLIENTS.items():
+            if cached is client:
+                del _MONGO_CLIENTS[key]
+                break
+        else:
+            return
+    client.close()
+
+
+@atexit.register
+def close_mongo_clients() -> None:
+    """关闭所有缓存的 MongoClient（进程退出时自动调用）"""
+    with _MONGO_CLIENTS_LOCK:
+        clients = list(_MONGO_CLIENTS.values())
+        _MONGO_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
 
 class DBOpsWorker(QThread):
     """
@@ -20,6 +310,8 @@ class DBOpsWorker(QThread):
     
     信号:
         result_signal: 执行结果 (status, data_type, content, metadata)
+            表格结果较大时，部分行会先经 chunk_signal 推送，content 仅包含剩余行
+        chunk_signal: 表格分批结果 (rows, columns)
         error_signal: 错误信息 (error_msg, sql_text)
         finished_signal: 执行完成
     """
@@ -30,9 +322,16 @@ class DBOpsWorker(QThread):
     # content: 实际数据
     # metadata: 额外信息（如执行时间、行数等）
     result_signal = Signal(str, str, object, dict)
+    chunk_signal = Signal(list, list)   # 表格分批结果 (rows, columns)
     error_signal = Signal(str, str)
     finished_signal = Signal()
     
+    # 每次 fetchmany 读取的行数
+    FETCH_CHUNK_SIZE = 1000
+    
+    # 表格结果分批推送的最小间隔（秒）
+    CHUNK_EMIT_INTERVAL = 0.05
+    
     def __init__(
         self,
         db_profile: Dict[str, Any],
@@ -65,7 +364,7 @@ class DBOpsWorker(QThread):
     def run(self) -> None:
         """执行运维操作"""
         self._is_running = True
-        start_time = __import__('time').time()
+        start_time = monotonic()
         
         try:
             db_type = self.db_profile.get("db_type", "").lower()
@@ -77,14 +376,14 @@ class DBOpsWorker(QThread):
                 result, metadata = self._execute_sql()
             
             # 计算执行时间
-            elapsed_ms = int((__import__('time').time() - start_time) * 1000)
+            elapsed_ms = int((monotonic() - start_time) * 1000)
             metadata['elapsed_ms'] = elapsed_ms
             
             if self._is_running:
                 self.result_signal.emit("success", self.result_type, result, metadata)
                 
         except Exception as e:
-            elapsed_ms = int((__import__('time').time() - start_time) * 1000)
+            elapsed_ms = int((monotonic() - start_time) * 1000)
             if self._is_running:
                 error_msg = self._parse_error(e, self.db_profile.get("db_type", ""))
                 self.error_signal.emit(error_msg, self.sql_text)
@@ -102,21 +401,16 @@ class DBOpsWorker(QThread):
             - result: 根据 result_type 可能是 list(list) 或 str
             - metadata: 包含行数、列信息等
         """
-        from sqlalchemy import create_engine, text
-        from sqlalchemy.exc import SQLAlchemyError
+        if not _HAS_SA:
+            raise ImportError("未安装 SQLAlchemy，请执行: pip install sqlalchemy")
         
         # 构建连接字符串
         connection_string = self._build_connection_string()
         if not connection_string:
             raise ValueError(f"不支持的数据库类型: {self.db_profile.get('db_type')}")
         
-        # 创建引擎
-        engine = create_engine(
-            connection_string,
-            connect_args={"connect_timeout": self.timeout},
-            pool_pre_ping=True,
-            echo=False
-        )
+        # 获取引擎（跨 Worker 复用，连接池保持已认证的连接）
+        engine = _get_engine(connection_string, self.timeout)
         
         metadata = {
             "row_count": 0,
@@ -125,8 +419,8 @@ class DBOpsWorker(QThread):
         }
         
         with engine.connect() as connection:
-            # 执行 SQL
-            result = connection.execute(text(self.sql_text))
+            # 执行 SQL（服务端游标流式读取，驱动不支持时自动退化为普通游标）
+            result = connection.execution_options(stream_results=True).execute(_text_clause(self.sql_text))
             
             # 检查是否有结果集
             if result.cursor is None:
@@ -153,44 +447,49 @@ class DBOpsWorker(QThread):
             if self.result_type == "text":
                 # 文本结果（如 SHOW ENGINE INNODB STATUS）
                 # 通常这类查询返回多行，每行是一个字段
-                rows = result.fetchall()
+                text_lines = []
+                while True:
+                    rows = result.fetchmany(self.FETCH_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    
+                    # 将结果拼接为文本
+                    for row in rows:
+                        # 每行可能是一个字段或多个字段
+                        if len(row) == 1:
+                            text_lines.append(str(row[0]) if row[0] is not None else "")
+                        else:
+                            text_lines.append(" | ".join(str(c) if c is not None else "NULL" for c in row))
                 
-                if not rows:
+                if not text_lines:
                     return "(无数据)", metadata
                 
-                # 将结果拼接为文本
-                text_lines = []
-                for row in rows:
-                    # 每行可能是一个字段或多个字段
-                    if len(row) == 1:
-                        text_lines.append(str(row[0]) if row[0] is not None else "")
-                    else:
-                        text_lines.append(" | ".join(str(c) if c is not None else "NULL" for c in row))
-                
                 full_text = "\n".join(text_lines)
-                metadata["row_count"] = len(rows)
+                metadata["row_count"] = len(text_lines)
                 
                 return full_text, metadata
             
             else:  # table
-                # 表格结果
-                rows = result.fetchall()
+                # 表格结果：分批读取，距上次推送超过 CHUNK_EMIT_INTERVAL 时先通过 chunk_signal 推送已处理的行
                 data = []
+                total = 0
+                last_emit = monotonic()
                 
-                for row in rows:
-                    row_data = []
-                    for value in row:
-                        if value is None:
-                            row_data.append("")
-                        else:
-                            # 截断过长字符串
-                            str_val = str(value)
-                            if len(str_val) > 1000:
-                                str_val = str_val[:997] + "..."
-                            row_data.append(str_val)
-                    data.append(row_data)
+                while True:
+                    rows = result.fetchmany(self.FETCH_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    
+                    data.extend(_stringify_rows(rows))
+                    total += len(rows)
+                    
+                    if self._is_running and monotonic() - last_emit >= self.CHUNK_EMIT_INTERVAL:
+                        self.chunk_signal.emit(data, metadata["columns"])
+                        data = []
+                        last_emit = monotonic()
                 
-                metadata["row_count"] = len(data)
+                # 返回尚未推送的剩余行，row_count 为总行数
+                metadata["row_count"] = total
                 return data, metadata
     
     def _execute_mongodb(self) -> Tuple[Any, Dict]:
@@ -200,8 +499,8 @@ class DBOpsWorker(QThread):
         Returns:
             (result, metadata)
         """
-        from pymongo import MongoClient
-        from pymongo.errors import PyMongoError
+        if not _HAS_PYMONGO:
+            raise ImportError("未安装 pymongo，请执行: pip install pymongo")
         
         host = self.db_profile.get("host", "localhost")
         port = self.db_profile.get("port", 27017)
@@ -209,36 +508,30 @@ class DBOpsWorker(QThread):
         password = self.db_profile.get("password", "")
         database = self.db_profile.get("database", "admin")
         
-        # 构建连接字符串
-        if username and password:
-            uri = f"mongodb://{username}:{password}@{host}:{port}/{database}"
-        else:
-            uri = f"mongodb://{host}:{port}/{database}"
+        # 复用客户端（不在每次执行后关闭，进程退出时统一关闭）
+        client = _get_mongo_client(host, port, username, password, database, self.timeout * 1000)
+        db = client[database]
         
-        client = MongoClient(uri, serverSelectionTimeoutMS=self.timeout * 1000)
+        # 解析命令
+        if isinstance(self.sql_text, dict):
+            cmd = self.sql_text
+        else:
+            # 尝试解析 JSON 字符串
+            cmd = _json_loads(self.sql_text)
         
+        # 执行命令
         try:
-            db = client[database]
-            
-            # 解析命令
-            if isinstance(self.sql_text, dict):
-                cmd = self.sql_text
-            else:
-                # 尝试解析 JSON 字符串
-                import json
-                cmd = json.loads(self.sql_text)
-            
-            # 执行命令
             result = db.command(cmd)
-            
-            # 转换为可显示的格式
-            import json
-            formatted = json.dumps(result, indent=2, default=str)
-            
-            return formatted, {"document_count": len(result) if isinstance(result, dict) else 0}
-            
-        finally:
-            client.close()
+        except (ConnectionFailure, OperationFailure) as e:
+            # 连接或认证失败的客户端不再复用；普通命令错误保留客户端
+            if isinstance(e, ConnectionFailure) or e.code == _MONGO_AUTH_FAILED:
+                _discard_mongo_client(client)
+            raise
+        
+        # 转换为可显示的格式
+        formatted = _json_dumps_pretty(result)
+        
+        return formatted, {"document_count": len(result) if isinstance(result, dict) else 0}
     
     def _build_connection_string(self) -> Optional[str]:
         """构建 SQLAlchemy 连接字符串"""
@@ -288,44 +581,25 @@ class DBOpsWorker(QThread):
         Returns:
             友好的错误信息
         """
-        error_str = str(error).lower()
         original = str(error)
+        error_str = original.lower()
         
-        # 通用错误
-        if "timeout" in error_str:
-            return f"连接超时（{self.timeout}秒），请检查网络或增加超时时间"
-        
-        if "access denied" in error_str or "login failed" in error_str:
-            return "认证失败：用户名或密码错误"
+        # 通用错误（按规则顺序判断，而非按关键字在文本中出现的位置）
+        key = _match_error_rule(error_str, _GENERIC_ERROR_RULES)
+        if key:
+            return _ERROR_MESSAGES[key].format(timeout=self.timeout)
         
-        if "unknown host" in error_str or "could not connect" in error_str:
-            return "无法连接到数据库服务器，请检查主机地址和端口"
-        
-        if "unknown database" in error_str or "database does not exist" in error_str:
-            return "数据库不存在，请检查数据库名称"
-        
-        # Oracle 特有错误
+        # Oracle 特有错误：提取一次 ORA 错误码，再按表中顺序查找
         if db_type == "oracle":
-            if "ora-00942" in error_str:
-                return "表或视图不存在，或当前用户无权限访问"
-            if "ora-01031" in error_str:
-                return "权限不足，需要 DBA 权限才能执行此操作"
-            if "ora-01555" in error_str:
-                return "快照过旧，查询时间太长或 UNDO 表空间不足"
-            if "ora-00054" in error_str:
-                return "资源正忙，对象被其他会话锁定"
-        
-        # MySQL 特有错误
-        if db_type in ["mysql", "mariadb"]:
-            if "syntax" in error_str:
-                return f"SQL 语法错误：\n{original[:200]}"
-            if "performance_schema" in error_str:
-                return "Performance Schema 未启用，某些查询无法执行"
-        
-        # SQL Server 特有错误
-        if db_type == "sqlserver":
-            if "invalid object name" in error_str:
-                return "对象不存在，请检查表名或视图名"
+            codes = set(_ORA_CODE_RE.findall(original))
+            for code, message in _ORA_CODES.items():
+                if code in codes:
+                    return message
+        
+        # MySQL / SQL Server 特有错误
+        key = _match_error_rule(error_str, _DB_ERROR_RULES.get(db_type, ()))
+        if key:
+            return _ERROR_MESSAGES[key].format(original=original[:200])
         
         # 默认返回原始错误（截断）
         if len(original) > 500:
@@ -3,17 +3,118 @@ Elasticsearch 工作线程 - 封装 ES HTTP API 操作
 
 依赖安装:
     pip install requests
+    
+    # 可选：加速大响应（_search、_cat/indices）的 JSON 解析
+    pip install orjson
 
 功能:
 - 索引列表获取
 - 文档 CRUD 操作
 - 分页查询
+- 批量查询 (_msearch)
+- 批量写入 (_bulk)
 - Basic Auth 支持
 """
 
+import atexit
 import json
-from typing import Any, Dict, List, Optional, Tuple
-from PySide6.QtCore import QThread, Signal
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# orjson 为可选依赖（C 实现，直接解析响应字节），未安装时使用标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析 JSON 响应体（优先使用 orjson，省去先解码为 str 的一步）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    序列化为 UTF-8 JSON 字节
+    
+    优先使用 orjson；遇到 orjson 不支持的值（如超出 64 位的整数）时回退到标准库。
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# _bulk 默认分块：单块文档数上限与字节数上限，先到者为准
+# 平均文档较大时 chunk_size 应不超过 max_chunk_bytes / 平均文档大小
+BULK_CHUNK_SIZE = 1000
+BULK_MAX_CHUNK_BYTES = 5 * 1024 * 1024
+
+
+def _iter_bulk_chunks(
+    index: str,
+    ops: Iterable[Tuple[str, Optional[str], Optional[Dict]]],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES
+) -> Iterator[Tuple[bytes, int]]:
+    """
+    将批量操作序列化为 _bulk 的 NDJSON 请求体并分块
+    
+    Args:
+        index: 索引名称
+        ops: [(动作, 文档 ID, 文档), ...]，动作为 index/create/update/delete，
+            delete 不需要文档，ID 为 None 时由 ES 生成（仅 index/create）
+        chunk_size: 每块最多操作数
+        max_chunk_bytes: 每块最大字节数
+        
+    Yields:
+        (请求体, 操作数)
+    """
+    lines: List[bytes] = []
+    size = 0
+    count = 0
+    for action, doc_id, doc in ops:
+        meta = {"_index": index}
+        if doc_id is not None:
+            meta["_id"] = doc_id
+        entry = _json_dumps({action: meta}) + b"\n"
+        if action != "delete":
+            # update 动作要求文档包在 "doc" 中
+            source = {"doc": doc} if action == "update" else doc
+            entry += _json_dumps(source) + b"\n"
+        
+        if count and (count >= chunk_size or size + len(entry) > max_chunk_bytes):
+            yield b"".join(lines), count
+            lines, size, count = [], 0, 0
+        
+        lines.append(entry)
+        size += len(entry)
+        count += 1
+    
+    if count:
+        yield b"".join(lines), count
+
+
+# search_docs 的请求体模板（match_all + 按 _id 排序）
+_SEARCH_FROM_TMPL = b'{"from":%d,"size":%d,"query":{"match_all":{}},"sort":[{"_id":{"order":"asc"}}]}'
+_SEARCH_AFTER_TMPL = b'{"size":%d,"search_after":%s,"query":{"match_all":{}},"sort":[{"_id":{"order":"asc"}}]}'
+
+# 索引列表的列：(结果键, _cat/indices 字段, 缺省值)
+_INDEX_COLUMNS = (
+    ("name", "index", ""),
+    ("docs_count", "docs.count", "0"),
+    ("store_size", "store.size", "0b"),
+    ("health", "health", "unknown"),
+    ("status", "status", "unknown"),
+)
+_INDEX_CAT_COLUMNS = ",".join(field for _, field, _ in _INDEX_COLUMNS)
 
 
 class ESClient:
@@ -21,9 +122,20 @@ class ESClient:
     Elasticsearch HTTP 客户端
     
     封装 ES REST API 调用
+    
+    连接池大小由 pool_size（连接配置中的 "pool_size"）决定：同时使用同一客户端的
+    线程数超过 urllib3 池的 maxsize 时，多出的请求只能新建连接且用完即弃，
+    因此 maxsize 至少取并发线程数的 2 倍。
     """
     
-    def __init__(self, host: str, port: int, username: str = "", password: str = ""):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        pool_size: int = 4
+    ):
         """
         初始化 ES 客户端
         
@@ -32,6 +144,7 @@ class ESClient:
             port: ES 端口
             username: 用户名（可选）
             password: 密码（可选）
+            pool_size: 预计并发使用该客户端的线程数
         """
         self.host = host
         self.port = port
@@ -42,11 +155,29 @@ class ESClient:
         # 导入 requests
         try:
             import requests
+            from requests.adapters import HTTPAdapter
             from requests.auth import HTTPBasicAuth
+            from urllib3.util.retry import Retry
             self.requests = requests
             self.auth = HTTPBasicAuth(username, password) if username and password else None
         except ImportError:
             raise ImportError("缺少 requests 库，请执行: pip install requests")
+        
+        # 复用 Session：keep-alive 连接池避免每次请求重新建立 TCP 连接
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.verify = False  # 忽略 SSL 验证（内网环境）
+        self.session.mount("http://", HTTPAdapter(
+            pool_connections=max(4, pool_size),
+            pool_maxsize=max(32, pool_size * 2),
+            pool_block=False,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+    
+    def close(self) -> None:
+        """关闭 Session，释放连接池中的连接"""
+        self.session.close()
     
     def _request(self, method: str, endpoint: str, **kwargs) -> Tuple[bool, Any]:
         """
@@ -62,18 +193,20 @@ class ESClient:
         """
         url = f"{self.base_url}{endpoint}"
         
+        # 自行序列化 json= 参数（Content-Type 由 Session 默认头提供）
+        if "json" in kwargs:
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+        
         try:
-            response = self.requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
-                auth=self.auth,
                 timeout=30,
-                verify=False,  # 忽略 SSL 验证（内网环境）
                 **kwargs
             )
             
             if response.status_code in [200, 201]:
-                return True, response.json()
+                return True, _json_loads(response.content)
             elif response.status_code == 404:
                 return False, "资源不存在"
             elif response.status_code == 401:
@@ -88,55 +221,272 @@ class ESClient:
         except Exception as e:
             return False, f"请求异常: {str(e)}"
     
-    def list_indices(self) -> Tuple[bool, List[Dict]]:
+    def list_indices(self) -> Tuple[bool, Dict[str, List[str]]]:
         """
         获取索引列表
         
         Returns:
-            (success, indices_list)
+            (success, indices)
+            - indices: 按列存放的并行列表 {"name": [...], "docs_count": [...],
+              "store_size": [...], "health": [...], "status": [...]}，同一下标为同一索引
         """
-        success, data = self._request("GET", "/_cat/indices?format=json&bytes=b")
+        # 只请求需要的列，减小响应体
+        success, data = self._request(
+            "GET", f"/_cat/indices?format=json&bytes=b&h={_INDEX_CAT_COLUMNS}"
+        )
         if success:
-            # 解析索引信息
-            indices = []
-            for idx in data:
-                indices.append({
-                    'name': idx.get('index', ''),
-                    'docs_count': idx.get('docs.count', '0'),
-                    'store_size': idx.get('store.size', '0b'),
-                    'health': idx.get('health', 'unknown'),
-                    'status': idx.get('status', 'unknown')
-                })
+            indices = {
+                key: [idx.get(field, default) for idx in data]
+                for key, field, default in _INDEX_COLUMNS
+            }
             return True, indices
         return False, data
     
-    def search_docs(self, index: str, page: int = 1, size: int = 20) -> Tuple[bool, Dict]:
+    def search_docs(
+        self,
+        index: str,
+        page: int = 1,
+        size: int = 20,
+        search_after: Optional[list] = None
+    ) -> Tuple[bool, Dict]:
         """
         搜索文档
         
+        提供 search_after 时从上一页最后一条的排序值继续（深翻页开销恒定），
+        否则按 from/size 定位（仅适合随机跳转到前 10000 条以内的页）。
+        
         Args:
             index: 索引名称
-            page: 页码（从1开始）
+            page: 页码（从1开始，未提供 search_after 时使用）
             size: 每页数量
+            search_after: 上一页返回的 next_after
             
         Returns:
             (success, result)
+            - result 额外包含 next_after（本页最后一条的排序值，无数据时为 None）
+        """
+        # 请求体由预先序列化的模板拼接，无需每页构造 dict 再序列化
+        if search_after is not None:
+            body = _SEARCH_AFTER_TMPL % (size, _json_dumps(search_after))
+        else:
+            body = _SEARCH_FROM_TMPL % ((page - 1) * size, size)
+        
+        success, data = self._request(
+            "POST",
+            f"/{index}/_search",
+            data=body
+        )
+        if success:
+            hits = data.get("hits", {}).get("hits", [])
+            data["next_after"] = hits[-1].get("sort") if hits else None
+        return success, data
+    
+    def iter_hits(
+        self,
+        index: str,
+        query: Optional[Dict] = None,
+        batch_size: int = 500
+    ) -> Iterator[List[Dict]]:
         """
-        from_val = (page - 1) * size
+        分批遍历索引中的文档（用于导出等全量读取场景）
         
+        每批通过 search_after 续读，内存占用只与 batch_size 有关，
+        调用方收到第一批即可开始处理。
+        
+        Args:
+            index: 索引名称
+            query: 查询条件，默认 match_all
+            batch_size: 每批文档数
+            
+        Yields:
+            hits 列表
+            
+        Raises:
+            RuntimeError: 请求失败
+        """
         payload = {
-            "from": from_val,
-            "size": size,
-            "query": {"match_all": {}},
+            "size": batch_size,
+            "query": query or {"match_all": {}},
             "sort": [{"_id": {"order": "asc"}}]
         }
         
-        return self._request(
+        while True:
+            success, data = self._request("POST", f"/{index}/_search", json=payload)
+            if not success:
+                raise RuntimeError(str(data))
+            
+            hits = data.get("hits", {}).get("hits", [])
+            if not hits:
+                return
+            yield hits
+            
+            if len(hits) < batch_size:
+                return
+            payload["search_after"] = hits[-1].get("sort")
+    
+    def msearch(self, queries: List[Tuple[str, Dict]]) -> Tuple[bool, Any]:
+        """
+        批量搜索（一次 /_msearch 请求执行多个查询）
+        
+        Args:
+            queries: [(索引名称, 查询体), ...]
+            
+        Returns:
+            (success, results)
+            - results: 与 queries 顺序一致的 [(success, 单个查询结果或错误信息), ...]
+        """
+        # NDJSON：每个查询一行 header + 一行 body，末尾必须有换行
+        body = b"".join(
+            _json_dumps({"index": index}) + b"\n" + _json_dumps(query) + b"\n"
+            for index, query in queries
+        )
+        
+        success, data = self._request(
             "POST",
-            f"/{index}/_search",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            "/_msearch",
+            data=body,
+            headers={"Content-Type": "application/x-ndjson"}
         )
+        if not success:
+            return False, data
+        
+        results = []
+        for response in data.get("responses", []):
+            if "error" in response:
+                error = response["error"]
+                reason = error.get("reason", error) if isinstance(error, dict) else error
+                results.append((False, str(reason)))
+            else:
+                results.append((True, response))
+        return True, results
+    
+    def _bulk_request(self, body: bytes, count: int) -> Tuple[int, List[str]]:
+        """
+        发送单个 _bulk 请求块
+        
+        Args:
+            body: NDJSON 请求体
+            count: 块内操作数
+            
+        Returns:
+            (成功数, 错误信息列表)
+        """
+        success, data = self._request(
+            "POST",
+            "/_bulk",
+            data=body,
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+        if not success:
+            return 0, [str(data)]
+        
+        if not data.get("errors"):
+            return count, []
+        
+        # 逐条检查失败项
+        errors = []
+        for item in data.get("items", []):
+            result = next(iter(item.values()))
+            if "error" in result:
+                error = result["error"]
+                reason = error.get("reason", error) if isinstance(error, dict) else error
+                errors.append(f"{result.get('_id', '')}: {reason}")
+        return count - len(errors), errors
+    
+    def bulk(
+        self,
+        index: str,
+        ops: Iterable[Tuple[str, Optional[str], Optional[Dict]]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES
+    ) -> Tuple[bool, Dict]:
+        """
+        批量写入/删除文档（按块发送 /_bulk 请求）
+        
+        Args:
+            index: 索引名称
+            ops: [(动作, 文档 ID, 文档), ...]，见 _iter_bulk_chunks
+            chunk_size: 每块最多操作数
+            max_chunk_bytes: 每块最大字节数
+            
+        Returns:
+            (是否全部成功, {"succeeded": 成功数, "failed": 失败数, "errors": [错误信息, ...]})
+        """
+        succeeded = 0
+        failed = 0
+        errors: List[str] = []
+        for body, count in _iter_bulk_chunks(index, ops, chunk_size, max_chunk_bytes):
+            ok_count, chunk_errors = self._bulk_request(body, count)
+            succeeded += ok_count
+            failed += count - ok_count
+            errors.extend(chunk_errors)
+        
+        return failed == 0, {"succeeded": succeeded, "failed": failed, "errors": errors}
+    
+    def parallel_bulk(
+        self,
+        index: str,
+        ops: Iterable[Tuple[str, Optional[str], Optional[Dict]]],
+        thread_count: int = 4,
+        queue_size: int = 4,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = BULK_MAX_CHUNK_BYTES,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[bool, Dict]:
+        """
+        多线程批量写入/删除文档
+        
+        当前线程负责分块，thread_count 个线程共享同一 Session 并发发送 _bulk 请求。
+        待发送的块放在容量为 queue_size 的队列中，内存占用约为
+        (thread_count + queue_size) * max_chunk_bytes。
+        
+        Args:
+            index: 索引名称
+            ops: [(动作, 文档 ID, 文档), ...]，见 _iter_bulk_chunks
+            thread_count: 并发请求线程数（不应超过连接池大小）
+            queue_size: 待发送块的队列容量
+            chunk_size: 每块最多操作数
+            max_chunk_bytes: 每块最大字节数
+            progress: 进度回调 (已处理数, 失败数)，在发送线程中调用
+            
+        Returns:
+            同 bulk()
+        """
+        chunks: "queue.Queue[Optional[Tuple[bytes, int]]]" = queue.Queue(maxsize=queue_size)
+        lock = threading.Lock()
+        totals = {"succeeded": 0, "failed": 0, "errors": []}
+        
+        def consume() -> None:
+            while True:
+                item = chunks.get()
+                if item is None:
+                    return
+                body, count = item
+                try:
+                    ok_count, chunk_errors = self._bulk_request(body, count)
+                except Exception as e:
+                    ok_count, chunk_errors = 0, [f"请求异常: {e}"]
+                with lock:
+                    totals["succeeded"] += ok_count
+                    totals["failed"] += count - ok_count
+                    totals["errors"].extend(chunk_errors)
+                    processed = totals["succeeded"] + totals["failed"]
+                    failed = totals["failed"]
+                if progress:
+                    progress(processed, failed)
+        
+        with ThreadPoolExecutor(max_workers=thread_count) as pool:
+            for _ in range(thread_count):
+                pool.submit(consume)
+            try:
+                for chunk in _iter_bulk_chunks(index, ops, chunk_size, max_chunk_bytes):
+                    chunks.put(chunk)
+            finally:
+                # 每个发送线程一个结束标记
+                for _ in range(thread_count):
+                    chunks.put(None)
+        
+        return totals["failed"] == 0, totals
     
     def get_doc(self, index: str, doc_id: str) -> Tuple[bool, Dict]:
         """
@@ -165,8 +515,7 @@ class ESClient:
         return self._request(
             "POST",
             f"/{index}/_doc",
-            json=data,
-            headers={"Content-Type": "application/json"}
+            json=data
         )
     
     def update_doc(self, index: str, doc_id: str, data: Dict) -> Tuple[bool, Dict]:
@@ -184,8 +533,7 @@ class ESClient:
         return self._request(
             "PUT",
             f"/{index}/_doc/{doc_id}",
-            json=data,
-            headers={"Content-Type": "application/json"}
+            json=data
         )
     
     def delete_doc(self, index: str, doc_id: str) -> Tuple[bool, str]:
@@ -205,44 +553,155 @@ class ESClient:
         return False, str(data)
 
 
-class ESWorker(QThread):
+# 已创建的 ESClient，按连接参数复用（Session 的 keep-alive 连接跨操作、跨窗口保留）
+_ES_CLIENTS: Dict[Tuple, ESClient] = {}
+_ES_CLIENTS_LOCK = threading.Lock()
+
+
+def get_es_client(profile: Dict[str, Any]) -> ESClient:
     """
-    Elasticsearch 异步工作线程
+    获取 ESClient（按主机、端口、用户名、密码和连接池大小缓存）
     
-    避免 UI 卡顿
+    Args:
+        profile: ES 连接配置
+        
+    Returns:
+        共享的 ESClient 对象，进程退出时由 close_es_clients 统一关闭
+    """
+    key = (
+        profile.get("host", "localhost"),
+        profile.get("port", 9200),
+        profile.get("username", ""),
+        profile.get("password", ""),
+        profile.get("pool_size", 4),
+    )
+    with _ES_CLIENTS_LOCK:
+        client = _ES_CLIENTS.get(key)
+        if client is None:
+            host, port, username, password, pool_size = key
+            client = ESClient(host, port, username, password, pool_size)
+            _ES_CLIENTS[key] = client
+    return client
+
+
+@atexit.register
+def close_es_clients() -> None:
+    """关闭所有缓存的 ESClient（进程退出时自动调用）"""
+    with _ES_CLIENTS_LOCK:
+        while _ES_CLIENTS:
+            _, client = _ES_CLIENTS.popitem()
+            client.close()
+
+
+# ES 操作共享线程池：复用少量线程，避免每个操作新建一个 QThread
+ES_POOL_THREADS = 4
+_ES_POOL: Optional[QThreadPool] = None
+
+
+def _get_es_pool() -> QThreadPool:
+    """获取 ES 操作线程池（首次调用时创建）"""
+    global _ES_POOL
+    if _ES_POOL is None:
+        _ES_POOL = QThreadPool()
+        _ES_POOL.setMaxThreadCount(ES_POOL_THREADS)
+    return _ES_POOL
+
+
+# 已提交且尚未结束的 ESWorker：界面关闭后任务仍在池中执行时保持对象存活
+_RUNNING_WORKERS: set = set()
+
+
+class ESRunnable(QRunnable):
+    """
+    线程池任务：在池线程中执行 ESWorker.run
+    
+    QRunnable 不是 QObject，信号由持有它的 ESWorker 发出
+    """
+    
+    def __init__(self, worker: "ESWorker"):
+        super().__init__()
+        self.worker = worker
+        # 由 ESWorker 持有并重复提交，不能在执行后被自动删除
+        self.setAutoDelete(False)
+    
+    def run(self) -> None:
+        self.worker.run()
+
+
+class ESWorker(QObject):
+    """
+    Elasticsearch 异步任务
+    
+    操作提交到共享线程池执行，避免 UI 卡顿
     """
     
     # 信号定义
-    indices_ready = Signal(list)           # 索引列表就绪
+    indices_ready = Signal(dict)           # 索引列表就绪（按列存放的并行列表）
     docs_ready = Signal(dict)              # 文档列表就绪
+    docs_chunk_ready = Signal(list)        # 分批读取的一批文档 (hits)
     doc_ready = Signal(dict)               # 单个文档就绪
     operation_finished = Signal(bool, str) # 操作完成 (success, message)
+    bulk_progress = Signal(int, int)       # 批量操作进度 (已处理数, 失败数)
     error_occurred = Signal(str)           # 错误发生
     
-    def __init__(self, profile: Dict[str, Any], parent=None):
+    def __init__(self, profile: Dict[str, Any], client: Optional[ESClient] = None, parent=None):
         """
         初始化工作线程
         
         Args:
             profile: ES 连接配置
+            client: 使用的 ESClient（可选），未提供时按 profile 获取共享客户端
             parent: 父对象
         """
         super().__init__(parent)
         
         self.profile = profile
-        self.client: Optional[ESClient] = None
+        self.client: Optional[ESClient] = client
         self._operation: str = ""
         self._params: Dict = {}
+        self._is_running = False
+        self._cancelled = False
+        self._done = threading.Event()
+        self._runnable = ESRunnable(self)
+    
+    def start(self) -> None:
+        """提交到 ES 线程池（已在执行时忽略重复提交）"""
+        if self._is_running:
+            return
+        self._is_running = True
+        self._done.clear()
+        _RUNNING_WORKERS.add(self)
+        _get_es_pool().start(self._runnable)
+    
+    def is_running(self) -> bool:
+        """检查是否正在运行"""
+        return self._is_running
+    
+    def wait(self, msecs: int = -1) -> bool:
+        """
+        等待当前操作结束（与 QThread.wait 一致，单位为毫秒）
+        
+        Args:
+            msecs: 超时毫秒数，负数表示一直等待
+            
+        Returns:
+            是否已结束
+        """
+        return not self._is_running or self._done.wait(None if msecs < 0 else msecs / 1000)
+    
+    def cancel(self) -> None:
+        """
+        取消当前操作：不再发出任何信号，分批读取在下一批前停止
+        
+        进行中的 HTTP 请求无法中断，任务会在请求返回后结束；取消后不应再复用此对象。
+        """
+        self._cancelled = True
+        self.blockSignals(True)
     
     def setup_client(self) -> bool:
-        """初始化客户端"""
+        """初始化客户端（使用按连接参数共享的客户端）"""
         try:
-            self.client = ESClient(
-                host=self.profile.get("host", "localhost"),
-                port=self.profile.get("port", 9200),
-                username=self.profile.get("username", ""),
-                password=self.profile.get("password", "")
-            )
+            self.client = get_es_client(self.profile)
             return True
         except Exception as e:
             self.error_occurred.emit(f"客户端初始化失败: {e}")
@@ -253,10 +712,22 @@ class ESWorker(QThread):
         self._operation = "list_indices"
         self.start()
     
-    def search_docs(self, index: str, page: int = 1, size: int = 20):
-        """异步搜索文档"""
+    def search_docs(self, index: str, page: int = 1, size: int = 20, search_after: Optional[list] = None):
+        """异步搜索文档（search_after 为上一页结果中的 next_after）"""
         self._operation = "search_docs"
-        self._params = {"index": index, "page": page, "size": size}
+        self._params = {"index": index, "page": page, "size": size, "search_after": search_after}
+        self.start()
+    
+    def scan_docs(self, index: str, query: Optional[Dict] = None, batch_size: int = 500):
+        """异步分批读取全部文档（每批通过 docs_chunk_ready 发送，结束时发送 operation_finished）"""
+        self._operation = "scan_docs"
+        self._params = {"index": index, "query": query, "batch_size": batch_size}
+        self.start()
+    
+    def msearch_docs(self, queries: List[Tuple[str, Dict]]):
+        """异步批量搜索（结果以 {"responses": [(success, result), ...]} 通过 docs_ready 发送）"""
+        self._operation = "msearch_docs"
+        self._params = {"queries": queries}
         self.start()
     
     def get_doc(self, index: str, doc_id: str):
@@ -277,6 +748,12 @@ class ESWorker(QThread):
         self._params = {"index": index, "doc_id": doc_id, "data": data}
         self.start()
     
+    def bulk_docs(self, index: str, ops: List[Tuple[str, Optional[str], Optional[Dict]]]):
+        """异步批量写入/删除文档（ops 格式见 ESClient.bulk）"""
+        self._operation = "bulk_docs"
+        self._params = {"index": index, "ops": ops}
+        self.start()
+    
     def delete_doc(self, index: str, doc_id: str):
         """异步删除文档"""
         self._operation = "delete_doc"
@@ -284,11 +761,11 @@ class ESWorker(QThread):
         self.start()
     
     def run(self):
-        """执行异步操作"""
-        if not self.client and not self.setup_client():
-            return
-        
+        """执行异步操作（在池线程中调用）"""
         try:
+            if not self.client and not self.setup_client():
+                return
+            
             if self._operation == "list_indices":
                 success, data = self.client.list_indices()
                 if success:
@@ -299,13 +776,30 @@ class ESWorker(QThread):
             elif self._operation == "search_docs":
                 p = self._params
                 success, data = self.client.search_docs(
-                    p["index"], p["page"], p["size"]
+                    p["index"], p["page"], p["size"], p.get("search_after")
                 )
                 if success:
                     self.docs_ready.emit(data)
                 else:
                     self.error_occurred.emit(str(data))
             
+            elif self._operation == "scan_docs":
+                p = self._params
+                total = 0
+                for hits in self.client.iter_hits(p["index"], p["query"], p["batch_size"]):
+                    if self._cancelled:
+                        break
+                    self.docs_chunk_ready.emit(hits)
+                    total += len(hits)
+                self.operation_finished.emit(True, f"共读取 {total} 条文档")
+            
+            elif self._operation == "msearch_docs":
+                success, data = self.client.msearch(self._params["queries"])
+                if success:
+                    self.docs_ready.emit({"responses": data})
+                else:
+                    self.error_occurred.emit(str(data))
+            
             elif self._operation == "get_doc":
                 p = self._params
                 success, data = self.client.get_doc(p["index"], p["doc_id"])
@@ -328,6 +822,18 @@ class ESWorker(QThread):
                 self.operation_finished.emit(success,
                     "文档更新成功" if success else str(data))
             
+            elif self._operation == "bulk_docs":
+                p = self._params
+                success, data = self.client.parallel_bulk(
+                    p["index"], p["ops"],
+                    thread_count=self.profile.get("pool_size", 4),
+                    progress=self.bulk_progress.emit
+                )
+                message = f"批量操作完成: 成功 {data['succeeded']} 条, 失败 {data['failed']} 条"
+                if data["errors"]:
+                    message += "\n" + "\n".join(data["errors"][:10])
+                self.operation_finished.emit(success, message)
+            
             elif self._operation == "delete_doc":
                 p = self._params
                 success, msg = self.client.delete_doc(p["index"], p["doc_id"])
@@ -335,3 +841,8 @@ class ESWorker(QThread):
                 
         except Exception as e:
             self.error_occurred.emit(f"操作异常: {e}")
+        
+        finally:
+            self._is_running = False
+            self._done.set()
+            _RUNNING_WORKERS.discard(self)
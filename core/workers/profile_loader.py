@@ -0,0 +1,47 @@
+"""
+连接配置加载工作线程 - 在后台读取连接配置并分批返回
+
+避免配置文件位于网络盘等慢速存储时阻塞界面
+"""
+
+from PySide6.QtCore import QThread, Signal
+
+from core.managers.connection_manager import ConnectionManager
+
+
+# 每批发送的配置条数
+PROFILE_BATCH_SIZE = 50
+
+
+class ProfileLoaderWorker(QThread):
+    """
+    连接配置加载线程
+    
+    信号:
+        profiles_loaded: 每读取到一批配置发送一次 (profiles)
+        finished: 全部发送完毕（QThread 内置信号）
+    """
+    
+    profiles_loaded = Signal(list)
+    
+    def __init__(self, connection_manager: ConnectionManager, parent=None):
+        """
+        初始化加载线程
+        
+        Args:
+            connection_manager: 连接配置管理器
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.connection_manager = connection_manager
+    
+    def run(self) -> None:
+        """读取配置并按 PROFILE_BATCH_SIZE 分批发送"""
+        batch = []
+        for profile in self.connection_manager.load_profiles():
+            batch.append(profile)
+            if len(batch) >= PROFILE_BATCH_SIZE:
+                self.profiles_loaded.emit(batch)
+                batch = []
+        if batch:
+            self.profiles_loaded.emit(batch)
@@ -5,10 +5,208 @@ SQL 执行工作线程 - 在后台执行 SQL 查询并返回结果
     pip install sqlalchemy pymysql
 """
 
+import atexit
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 from PySide6.QtCore import QThread, Signal
 
 
+# SQL 首个关键字
+_FIRST_WORD_RE = re.compile(r"\s*(\w+)")
+
+# 返回结果集的语句
+_QUERY_KEYWORDS = frozenset({"SELECT", "SHOW", "DESCRIBE", "DESC", "EXPLAIN"})
+
+# 非查询语句的动作名称
+_ACTION_NAMES = {
+    "INSERT": "插入",
+    "UPDATE": "更新",
+    "DELETE": "删除",
+    "CREATE": "创建",
+    "DROP": "删除",
+    "ALTER": "修改",
+}
+
+
+def _sql_keyword(sql: str) -> str:
+    """
+    提取 SQL 首个关键字（大写）
+    
+    Args:
+        sql: SQL 语句
+        
+    Returns:
+        首个关键字，无法识别时返回空字符串
+    """
+    match = _FIRST_WORD_RE.match(sql)
+    return match.group(1).upper() if match else ""
+
+
+# 常见错误分类规则 (_ERROR_MESSAGES 的键, 关键字组)，按优先级排列，命中第一条即返回
+# 每个关键字组内任一小写关键字出现即满足，规则的所有关键字组都满足才算命中
+_ERROR_RULES = (
+    ("auth", (("access denied", "1045"),)),
+    ("no_database", (("unknown database", "1049"),)),
+    ("unreachable", (("can't connect", "2003"),)),
+    ("no_table", (("table",), ("doesn't exist", "does not exist"))),
+    ("no_column", (("column",), ("unknown",))),
+    ("syntax", (("syntax",),)),
+    ("timeout", (("timeout",),)),
+    ("permission", (("permission", "denied"),)),
+)
+
+_ERROR_MESSAGES = {
+    "auth": "数据库认证失败：用户名或密码错误",
+    "no_database": "数据库不存在：请检查数据库名称",
+    "unreachable": "无法连接到数据库服务器：请检查网络和端口",
+    "no_table": "表不存在：请检查表名是否正确",
+    "no_column": "列不存在：请检查列名是否正确",
+    "syntax": "SQL 语法错误：\n{original}",
+    "timeout": "连接超时：请检查网络状况",
+    "permission": "权限不足：当前用户无法执行此操作",
+}
+
+# 单元格显示的最大字符数，超出部分截断为 "..."
+MAX_CELL_LENGTH = 1000
+
+
+def _stringify_rows(rows) -> List[List[str]]:
+    """
+    将结果行转换为字符串矩阵（None 显示为空，过长字符串截断）
+    
+    Args:
+        rows: SQLAlchemy 结果行
+        
+    Returns:
+        二维字符串列表
+    """
+    limit = MAX_CELL_LENGTH
+    return [
+        [
+            "" if v is None else (s if len(s := str(v)) <= limit else s[:limit - 3] + "...")
+            for v in row
+        ]
+        for row in rows
+    ]
+
+
+@lru_cache(maxsize=32)
+def _build_conn_str(
+    db_type: str,
+    host: str,
+    port: int,
+    username: str,
+    password: str,
+    database: str
+) -> Optional[str]:
+    """
+    构建 SQLAlchemy 连接字符串（按连接参数缓存）
+    
+    Args:
+        db_type: 数据库类型（小写）
+        host: 主机地址
+        port: 端口号
+        username: 用户名
+        password: 密码
+        database: 数据库名称
+        
+    Returns:
+        连接字符串，不支持的类型返回 None
+    """
+    from urllib.parse import quote_plus
+    
+    safe_username = quote_plus(username)
+    safe_password = quote_plus(password)
+    
+    if db_type == "mysql":
+        if database:
+            return f"mysql+pymysql://{safe_username}:{safe_password}@{host}:{port}/{database}"
+        else:
+            return f"mysql+pymysql://{safe_username}:{safe_password}@{host}:{port}"
+    
+    elif db_type == "postgresql":
+        if database:
+            return f"postgresql+psycopg2://{safe_username}:{safe_password}@{host}:{port}/{database}"
+        else:
+            return f"postgresql+psycopg2://{safe_username}:{safe_password}@{host}:{port}"
+    
+    elif db_type == "sqlite":
+        if database:
+            return f"sqlite:///{database}"
+        else:
+            return "sqlite:///:memory:"
+    
+    elif db_type == "mssql":
+        if database:
+            return f"mssql+pyodbc://{safe_username}:{safe_password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+        else:
+            return f"mssql+pyodbc://{safe_username}:{safe_password}@{host}:{port}?driver=ODBC+Driver+17+for+SQL+Server"
+    
+    elif db_type == "oracle":
+        return f"oracle+cx_oracle://{safe_username}:{safe_password}@{host}:{port}/?service_name={database or 'ORCL'}"
+    
+    return None
+
+
+# 已创建的 SQLAlchemy 引擎，按连接字符串复用，最近最少使用的先淘汰
+_ENGINES: "OrderedDict[str, Any]" = OrderedDict()
+_ENGINES_LOCK = threading.Lock()
+
+# 缓存的引擎数量上限
+MAX_CACHED_ENGINES = 16
+
+
+def _get_engine(connection_string: str):
+    """
+    获取 SQLAlchemy 引擎（按连接字符串缓存）
+    
+    引擎自带连接池，跨 Worker 复用后再次执行无需重新建立 TCP 连接和认证；
+    连接字符串包含密码，修改密码后自然使用新引擎。超出上限时淘汰最久未用的引擎并释放其连接池。
+    
+    Args:
+        connection_string: SQLAlchemy 连接字符串
+        
+    Returns:
+        Engine 对象
+    """
+    from sqlalchemy import create_engine
+    
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(connection_string)
+        if engine is not None:
+            _ENGINES.move_to_end(connection_string)
+            return engine
+        
+        # 连接池大小使用默认值（5 + 10 溢出），SQLite 内存库的连接池不接受这两个参数
+        engine = create_engine(
+            connection_string,
+            connect_args={"connect_timeout": 5},
+            pool_pre_ping=True,
+            pool_recycle=1800,
+            echo=False
+        )
+        _ENGINES[connection_string] = engine
+        if len(_ENGINES) <= MAX_CACHED_ENGINES:
+            return engine
+        _, evicted = _ENGINES.popitem(last=False)
+    
+    evicted.dispose()
+    return engine
+
+
+@atexit.register
+def dispose_engines() -> None:
+    """释放所有缓存引擎的连接池（进程退出时自动调用）"""
+    with _ENGINES_LOCK:
+        engines = list(_ENGINES.values())
+        _ENGINES.clear()
+    for engine in engines:
+        engine.dispose()
+
+
 class SQLWorker(QThread):
     """
     SQL 执行工作线程
@@ -19,7 +217,8 @@ class SQLWorker(QThread):
     - 返回结构化结果或执行影响行数
     
     信号:
-        select_result_signal: SELECT 查询结果 (headers, rows)
+        select_result_signal: SELECT 查询结果 (headers, rows)，结果不超过一批时使用
+        select_chunk_signal: SELECT 查询结果分批 (headers, rows)，结果较多时逐批发送
         execute_result_signal: 非查询语句结果 (rowcount, message)
         error_signal: 错误信息
         finished_signal: 执行完成
@@ -29,6 +228,9 @@ class SQLWorker(QThread):
     # SELECT 查询结果: (表头列表, 数据行列表)
     select_result_signal = Signal(list, list)
     
+    # SELECT 查询分批结果: (表头列表, 本批数据行列表)
+    select_chunk_signal = Signal(list, list)
+    
     # 执行结果: (影响行数, 消息)
     execute_result_signal = Signal(int, str)
     
@@ -38,6 +240,9 @@ class SQLWorker(QThread):
     # 执行完成（无论成功失败）
     finished_signal = Signal()
     
+    # 每批读取的行数
+    FETCH_CHUNK_SIZE = 1000
+    
     def __init__(
         self,
         db_profile: Dict[str, Any],
@@ -70,7 +275,7 @@ class SQLWorker(QThread):
         
         try:
             # 延迟导入，避免模块加载时就需要依赖
-            from sqlalchemy import create_engine, text
+            from sqlalchemy import text
             from sqlalchemy.exc import SQLAlchemyError
             
             # 构建连接字符串
@@ -79,34 +284,27 @@ class SQLWorker(QThread):
                 self.error_signal.emit("不支持的数据库类型")
                 return
             
-            # 创建引擎
-            engine = create_engine(
-                connection_string,
-                connect_args={"connect_timeout": 5},
-                pool_pre_ping=True,
-                echo=False
-            )
+            # 获取引擎（跨 Worker 复用）
+            engine = _get_engine(connection_string)
             
-            # 执行 SQL
+            # 执行 SQL（从连接池取连接）
             with engine.connect() as connection:
-                # 使用 text() 包装 SQL 语句
+                # 判断 SQL 类型（只取首个关键字，不复制整条 SQL）
+                keyword = _sql_keyword(self.sql_text)
+                
+                # 使用 text() 包装 SQL 语句；SELECT 使用服务端游标流式读取
+                # （PostgreSQL 的服务端游标只支持 SELECT，其他语句使用普通游标）
                 stmt = text(self.sql_text)
+                if keyword == "SELECT":
+                    connection = connection.execution_options(stream_results=True)
                 result = connection.execute(stmt)
                 
-                # 判断 SQL 类型
-                sql_upper = self.sql_text.upper()
-                is_select = sql_upper.startswith("SELECT") or \
-                           sql_upper.startswith("SHOW") or \
-                           sql_upper.startswith("DESCRIBE") or \
-                           sql_upper.startswith("DESC") or \
-                           sql_upper.startswith("EXPLAIN")
-                
-                if is_select:
+                if keyword in _QUERY_KEYWORDS:
                     # SELECT 查询：获取表头和数据
                     self._handle_select_result(result)
                 else:
                     # 非查询语句：获取影响行数
-                    self._handle_execute_result(result, connection)
+                    self._handle_execute_result(result, connection, keyword)
                 
                 # 提交事务（对于需要的事务性操作）
                 connection.commit()
@@ -124,46 +322,14 @@ class SQLWorker(QThread):
     
     def _build_connection_string(self) -> Optional[str]:
         """构建 SQLAlchemy 连接字符串"""
-        from urllib.parse import quote_plus
-        
-        db_type = self.db_profile.get("db_type", "mysql").lower()
-        host = self.db_profile.get("host", "localhost")
-        port = self.db_profile.get("port", 3306)
-        username = self.db_profile.get("username", "")
-        password = self.db_profile.get("password", "")
-        database = self.db_profile.get("database", "")
-        
-        safe_username = quote_plus(username)
-        safe_password = quote_plus(password)
-        
-        if db_type == "mysql":
-            if database:
-                return f"mysql+pymysql://{safe_username}:{safe_password}@{host}:{port}/{database}"
-            else:
-                return f"mysql+pymysql://{safe_username}:{safe_password}@{host}:{port}"
-        
-        elif db_type == "postgresql":
-            if database:
-                return f"postgresql+psycopg2://{safe_username}:{safe_password}@{host}:{port}/{database}"
-            else:
-                return f"postgresql+psycopg2://{safe_username}:{safe_password}@{host}:{port}"
-        
-        elif db_type == "sqlite":
-            if database:
-                return f"sqlite:///{database}"
-            else:
-                return "sqlite:///:memory:"
-        
-        elif db_type == "mssql":
-            if database:
-                return f"mssql+pyodbc://{safe_username}:{safe_password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
-            else:
-                return f"mssql+pyodbc://{safe_username}:{safe_password}@{host}:{port}?driver=ODBC+Driver+17+for+SQL+Server"
-        
-        elif db_type == "oracle":
-            return f"oracle+cx_oracle://{safe_username}:{safe_password}@{host}:{port}/?service_name={database or 'ORCL'}"
-        
-        return None
+        return _build_conn_str(
+            self.db_profile.get("db_type", "mysql").lower(),
+            self.db_profile.get("host", "localhost"),
+            self.db_profile.get("port", 3306),
+            self.db_profile.get("username", ""),
+            self.db_profile.get("password", ""),
+            self.db_profile.get("database", "")
+        )
     
     def _handle_select_result(self, result) -> None:
         """
@@ -179,60 +345,35 @@ class SQLWorker(QThread):
             else:
                 headers = []
             
-            # 获取所有数据行
-            rows = result.fetchall()
-            
-            # 转换为列表格式（便于信号传递）
-            # rows 是 Row 对象列表，需要转换为普通列表
-            data = []
-            for row in rows:
-                # 处理每行数据
-                row_data = []
-                for value in row:
-                    # 将 None 转换为空字符串，其他转为字符串
-                    if value is None:
-                        row_data.append("")
-                    else:
-                        # 截断过长的字符串
-                        str_val = str(value)
-                        if len(str_val) > 1000:
-                            str_val = str_val[:997] + "..."
-                        row_data.append(str_val)
-                data.append(row_data)
+            # 不超过一批的结果一次性发送
+            rows = result.fetchmany(self.FETCH_CHUNK_SIZE)
+            if len(rows) < self.FETCH_CHUNK_SIZE:
+                self.select_result_signal.emit(headers, _stringify_rows(rows))
+                return
             
-            self.select_result_signal.emit(headers, data)
+            # 结果较多时逐批读取并发送，线程内只持有当前一批（界面表格仍会累积全部行）；stop() 后不再继续读取
+            while rows and self._is_running:
+                self.select_chunk_signal.emit(headers, _stringify_rows(rows))
+                rows = result.fetchmany(self.FETCH_CHUNK_SIZE)
             
         except Exception as e:
             self.error_signal.emit(f"处理查询结果失败: {str(e)}")
     
-    def _handle_execute_result(self, result, connection) -> None:
+    def _handle_execute_result(self, result, connection, keyword: str = "") -> None:
         """
         处理非查询语句结果
         
         Args:
             result: SQLAlchemy Result 对象
             connection: 数据库连接
+            keyword: SQL 首个关键字（大写）
         """
         try:
             # 获取影响行数
             rowcount = result.rowcount if hasattr(result, 'rowcount') else -1
             
             # 判断语句类型
-            sql_upper = self.sql_text.upper()
-            if sql_upper.startswith("INSERT"):
-                action = "插入"
-            elif sql_upper.startswith("UPDATE"):
-                action = "更新"
-            elif sql_upper.startswith("DELETE"):
-                action = "删除"
-            elif sql_upper.startswith("CREATE"):
-                action = "创建"
-            elif sql_upper.startswith("DROP"):
-                action = "删除"
-            elif sql_upper.startswith("ALTER"):
-                action = "修改"
-            else:
-                action = "执行"
+            action = _ACTION_NAMES.get(keyword, "执行")
             
             if rowcount >= 0:
                 message = f"{action}成功，影响 {rowcount} 行"
@@ -246,33 +387,14 @@ class SQLWorker(QThread):
     
     def _parse_error(self, error) -> str:
         """解析 SQLAlchemy 错误为友好信息"""
-        error_str = str(error).lower()
         original = str(error)
         
-        # 常见错误分类
-        if "access denied" in error_str or "1045" in error_str:
-            return "数据库认证失败：用户名或密码错误"
-        
-        elif "unknown database" in error_str or "1049" in error_str:
-            return "数据库不存在：请检查数据库名称"
-        
-        elif "can't connect" in error_str or "2003" in error_str:
-            return "无法连接到数据库服务器：请检查网络和端口"
-        
-        elif "table" in error_str and ("doesn't exist" in error_str or "does not exist" in error_str):
-            return "表不存在：请检查表名是否正确"
-        
-        elif "column" in error_str and "unknown" in error_str:
-            return "列不存在：请检查列名是否正确"
-        
-        elif "syntax" in error_str:
-            return f"SQL 语法错误：\n{original[:200]}"
-        
-        elif "timeout" in error_str:
-            return "连接超时：请检查网络状况"
+        error_str = original.lower()
         
-        elif "permission" in error_str or "denied" in error_str:
-            return "权限不足：当前用户无法执行此操作"
+        # 常见错误分类（按规则顺序判断）
+        for key, keyword_groups in _ERROR_RULES:
+            if all(any(k in error_str for k in group) for group in keyword_groups):
+                return _ERROR_MESSAGES[key].format(original=original[:200])
         
         # 默认返回原始错误（截断）
         return f"SQL 执行错误：\n{original[:300]}"
@@ -25,36 +25,46 @@ ImpleForge/
     pip install PySide6
 """
 
+import argparse
 import sys
 from pathlib import Path
-
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from typing import TYPE_CHECKING
 
 # 确保能导入 core 模块
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core.ui.main_window import MainWindow
+# PySide6 与主窗口（及其加载的各插件依赖）在 main() 中导入，
+# 使 --help 等无需界面的调用不必加载 Qt
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
 
-def load_stylesheet(app: QApplication, style_path: str) -> None:
+def load_stylesheet(app: "QApplication", style_path: str) -> None:
     """加载 QSS 样式文件"""
     style_file = Path(__file__).parent / style_path
-    if style_file.exists():
-        with open(style_file, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
-    else:
+    try:
+        # 直接读取，文件不存在时由异常处理（省去一次 exists() 的 stat 调用）
+        app.setStyleSheet(style_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
         print(f"[Warning] 样式文件不存在: {style_path}")
 
 
 def main():
+    # 先解析命令行，--help 在导入 Qt 之前退出；未识别的参数交给 Qt（如 -style）
+    parser = argparse.ArgumentParser(description="ImpleForge - Windows 实施工具箱")
+    _, qt_args = parser.parse_known_args()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+    from core.ui.main_window import MainWindow
+
     # 启用高 DPI 支持
     if hasattr(Qt, "AA_EnableHighDpiScaling"):
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     if hasattr(Qt, "AA_UseHighDpiPixmaps"):
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setApplicationName("ImpleForge")
     app.setApplicationDisplayName("ImpleForge - Windows 实施工具箱")
 
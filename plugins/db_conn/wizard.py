@@ -5,10 +5,13 @@
 """
 
 import sys
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# 仅在作为脚本直接运行时补充项目根目录；通过插件加载器导入时不修改 sys.path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
@@ -17,12 +20,131 @@ from PySide6.QtWidgets import (
     QButtonGroup, QSpinBox, QStackedWidget, QApplication,
     QFileDialog
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
 
-from core.managers.connection_manager import ConnectionManager
+from core.managers.connection_manager import get_connection_manager
 from core.utils.db_tester import test_db_connection, DBTestWorker
 from core.importers.yaml_importer import YamlConfigImporter
+from core.workers.profile_loader import ProfileLoaderWorker
+
+
+# 向导整体样式
+_WIZARD_STYLESHEET = """
+    QWidget { background-color: #1e1e1e; color: #cccccc; }
+    QLineEdit, QComboBox {
+        background-color: #3c3c3c;
+        border: 1px solid #3c3c3c;
+        padding: 8px;
+        border-radius: 4px;
+    }
+    QPushButton {
+        background-color: #0e639c;
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover { background-color: #1177bb; }
+    QGroupBox {
+        border: 1px solid #333;
+        margin-top: 10px;
+        padding-top: 10px;
+        font-weight: bold;
+    }
+"""
+
+# 配置管理按钮（刷新/删除）样式
+_PROFILE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        border: 1px solid #505050;
+        border-radius: 4px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #505050;
+        border-color: #6e6e6e;
+    }
+    QPushButton:pressed {
+        background-color: #094771;
+        color: white;
+    }
+"""
+
+# 按钮样式（模块级常量，避免每个实例重复构造字符串）
+_DANGER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #c75450;
+        color: white;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover { background-color: #d96864; }
+"""
+
+_IMPORT_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #238636;
+        color: white;
+        padding: 10px 20px;
+        border: none;
+        border-radius: 4px;
+    }
+    QPushButton:hover { background-color: #2ea043; }
+"""
+
+
+class LazyComboBox(QComboBox):
+    """
+    首次需要选项时才调用 loader 加载的下拉框
+    
+    loader 可以异步填充选项，填充完成后调用 finish_loading()；
+    加载期间请求的展开会推迟到 finish_loading() 时执行
+    """
+    
+    def __init__(self, loader: Callable[[], None], parent=None):
+        super().__init__(parent)
+        self._loader = loader
+        self._stale = True
+        self._popup_pending = False
+    
+    def reload(self) -> None:
+        """立即重新加载选项"""
+        self._stale = False
+        self._loader()
+    
+    def mark_loaded(self) -> None:
+        """选项已由调用方直接填充，不再需要加载"""
+        self._stale = False
+    
+    def finish_loading(self) -> None:
+        """选项加载完成，如有推迟的展开请求则此时展开"""
+        if self._popup_pending:
+            self._popup_pending = False
+            super().showPopup()
+    
+    def _ensure_loaded(self) -> None:
+        if self._stale:
+            self.reload()
+    
+    def showPopup(self) -> None:
+        if self._stale:
+            # 选项加载完成后再展开，避免弹出框按占位项的大小显示
+            self._popup_pending = True
+            self.reload()
+            return
+        super().showPopup()
+    
+    def focusInEvent(self, event) -> None:
+        # 键盘选择不会展开列表，获得焦点时即开始加载
+        self._ensure_loaded()
+        super().focusInEvent(event)
+    
+    def wheelEvent(self, event) -> None:
+        self._ensure_loaded()
+        super().wheelEvent(event)
 
 
 class ConnectionWizard(QWidget):
@@ -34,6 +156,42 @@ class ConnectionWizard(QWidget):
         "redis": 6379, "elasticsearch": 9200
     }
     
+    # 标题字体（首次创建向导时构造，之后复用）
+    _TITLE_FONT = None
+    
+    # 数据库类型下拉框的共享模型（首次创建向导时构造，之后复用）
+    _TYPE_MODEL = None
+    
+    # 数据库类型切换的防抖间隔（毫秒），连续切换只应用最后一次
+    DB_TYPE_DEBOUNCE_MS = 50
+    
+    # 测试按钮文字
+    _TEST_READY = "🚀 测试连接"
+    _TEST_RUNNING = "测试中..."
+    
+    # 表单数据的字段及默认值，_get_form_data 以其副本为基础填充
+    _FORM_TEMPLATE = {
+        "name": "",
+        "db_type": "",
+        "host": "",
+        "port": 0,
+        "username": "",
+        "password": "",
+        "database": "",
+        "auth_source": "",
+        "oracle_mode": "",
+        "oracle_value": ""
+    }
+    
+    # 基本配置表单的行：(标签, 控件属性名)
+    _BASIC_FIELDS = (
+        ("配置名称:", "name_input"),
+        ("数据库类型:", "type_combo"),
+        ("主机:端口", "host_port_layout"),
+        ("用户名:", "username_input"),
+        ("密码:", "password_input"),
+    )
+    
     DB_TYPE_LABELS = {
         "mysql": "MySQL", "mariadb": "MariaDB",
         "sqlserver": "SQL Server", "oracle": "Oracle", "mongodb": "MongoDB",
@@ -43,23 +201,49 @@ class ConnectionWizard(QWidget):
     def __init__(self, title: str = "数据库连接配置", parent=None):
         super().__init__(parent)
         self.title_text = title
-        self.connection_manager = ConnectionManager()
-        self.test_worker = None
+        self.connection_manager = get_connection_manager()
+        # 连接测试任务只创建一次，每次测试前更新 profile 后重新提交
+        self.test_worker = DBTestWorker(parent=self)
+        self.test_worker.success_signal.connect(self._on_test_success)
+        self.test_worker.error_signal.connect(self._on_test_error)
+        self.profile_loader = None
+        # 所有尚未结束的加载线程（含被替换的旧线程），关闭时逐个等待
+        self._profile_loaders = []
+        # 已加载的配置 {name: profile}，下拉框的 userData 只存配置名称
+        self._profiles_by_name = {}
+        # 类型下拉框连续变化时合并为一次页面/端口更新
+        self._db_type_timer = QTimer(self)
+        self._db_type_timer.setSingleShot(True)
+        self._db_type_timer.setInterval(self.DB_TYPE_DEBOUNCE_MS)
+        self._db_type_timer.timeout.connect(self._apply_db_type_change)
         self._setup_ui()
         self._apply_styles()
-        self._load_profiles()
+    
+    @classmethod
+    def _type_model(cls) -> QStandardItemModel:
+        """获取数据库类型下拉框的共享模型，所有向导实例共用同一份条目"""
+        if cls._TYPE_MODEL is None:
+            model = QStandardItemModel()
+            for key, label in cls.DB_TYPE_LABELS.items():
+                item = QStandardItem(label)
+                item.setData(key, Qt.UserRole)
+                model.appendRow(item)
+            cls._TYPE_MODEL = model
+        return cls._TYPE_MODEL
     
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(30, 30, 30, 30)
         main_layout.setSpacing(20)
         
-        # 标题
+        # 标题（字体对象在各实例间共享）
         title = QLabel(f"🔌 {self.title_text}")
-        font = QFont()
-        font.setPointSize(18)
-        font.setBold(True)
-        title.setFont(font)
+        if ConnectionWizard._TITLE_FONT is None:
+            font = QFont()
+            font.setPointSize(18)
+            font.setBold(True)
+            ConnectionWizard._TITLE_FONT = font
+        title.setFont(ConnectionWizard._TITLE_FONT)
         title.setStyleSheet("color: #cccccc;")
         main_layout.addWidget(title)
         
@@ -71,7 +255,9 @@ class ConnectionWizard(QWidget):
         profiles_group = QGroupBox("已保存的配置")
         profiles_layout = QHBoxLayout(profiles_group)
         
-        self.profile_combo = QComboBox()
+        # 配置列表在首次展开时加载
+        self.profile_combo = LazyComboBox(self._load_profiles)
+        self.profile_combo.addItem("-- 选择配置 --", None)
         self.profile_combo.setMinimumWidth(300)
         self.profile_combo.currentIndexChanged.connect(self._on_profile_selected)
         profiles_layout.addWidget(self.profile_combo)
@@ -80,7 +266,7 @@ class ConnectionWizard(QWidget):
         self.refresh_btn = QPushButton("刷新")
         self.refresh_btn.setToolTip("刷新配置列表")
         self.refresh_btn.setFixedSize(60, 32)
-        self.refresh_btn.clicked.connect(self._load_profiles)
+        self.refresh_btn.clicked.connect(self.profile_combo.reload)
         profiles_layout.addWidget(self.refresh_btn)
         
         # 删除按钮 - 使用文字+图标
@@ -94,15 +280,7 @@ class ConnectionWizard(QWidget):
         self.clear_all_btn = QPushButton("清空")
         self.clear_all_btn.setToolTip("一键清空所有配置")
         self.clear_all_btn.setFixedSize(60, 32)
-        self.clear_all_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c75450;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #d96864; }
-        """)
+        self.clear_all_btn.setStyleSheet(_DANGER_BUTTON_STYLE)
         self.clear_all_btn.clicked.connect(self._on_clear_all)
         profiles_layout.addWidget(self.clear_all_btn)
         
@@ -112,53 +290,92 @@ class ConnectionWizard(QWidget):
         config_group = QGroupBox("连接配置")
         config_layout = QVBoxLayout(config_group)
         
-        # 基本配置
-        basic_form = QFormLayout()
-        basic_form.setSpacing(12)
-        
+        # 基本配置：先创建控件，再按 _BASIC_FIELDS 一次性加入表单
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("配置名称")
-        basic_form.addRow("配置名称:", self.name_input)
         
         self.type_combo = QComboBox()
-        for key, label in self.DB_TYPE_LABELS.items():
-            self.type_combo.addItem(label, key)
+        self.type_combo.setModel(self._type_model())
         self.type_combo.currentIndexChanged.connect(self._on_db_type_changed)
-        basic_form.addRow("数据库类型:", self.type_combo)
         
         # 主机和端口
-        host_port = QHBoxLayout()
+        self.host_port_layout = QHBoxLayout()
         self.host_input = QLineEdit("localhost")
         self.port_input = QSpinBox()
         self.port_input.setRange(1, 65535)
         self.port_input.setValue(3306)
-        host_port.addWidget(self.host_input, 3)
-        host_port.addWidget(self.port_input, 1)
-        basic_form.addRow("主机:端口", host_port)
+        self.host_port_layout.addWidget(self.host_input, 3)
+        self.host_port_layout.addWidget(self.port_input, 1)
         
         self.username_input = QLineEdit()
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.Password)
-        basic_form.addRow("用户名:", self.username_input)
-        basic_form.addRow("密码:", self.password_input)
+        
+        basic_form = QFormLayout()
+        basic_form.setSpacing(12)
+        for label, attr in self._BASIC_FIELDS:
+            basic_form.addRow(label, getattr(self, attr))
         
         config_layout.addLayout(basic_form)
         
         # 动态特定配置
         self.specific_stack = QStackedWidget()
         
+        # 默认类型 (MySQL) 的页面立即构建，其余页面先放占位控件，首次切换时再构建
+        self._built_pages = set()
+        for _ in range(len(self._PAGE_BUILDERS)):
+            self.specific_stack.addWidget(QWidget())
+        self._show_page(0)
+        
+        config_layout.addWidget(self.specific_stack)
+        main_layout.addWidget(config_group)
+        
+        # 按钮
+        btn_layout = QHBoxLayout()
+        self.import_btn = QPushButton("📂 导入 YAML")
+        self.import_btn.setToolTip("从 application.yml 或配置文件导入")
+        self.import_btn.clicked.connect(self._on_import_yaml)
+        self.import_btn.setStyleSheet(_IMPORT_BUTTON_STYLE)
+        
+        self.test_btn = QPushButton(self._TEST_READY)
+        self.test_btn.clicked.connect(self._on_test)
+        self.save_btn = QPushButton("💾 保存")
+        self.save_btn.clicked.connect(self._on_save)
+        self.new_btn = QPushButton("➕ 新建")
+        self.new_btn.clicked.connect(self._on_new)
+        
+        btn_layout.addWidget(self.import_btn)
+        btn_layout.addWidget(self.test_btn)
+        btn_layout.addWidget(self.save_btn)
+        btn_layout.addWidget(self.new_btn)
+        btn_layout.addStretch()
+        main_layout.addLayout(btn_layout)
+        
+        # 状态
+        self.status_label = QLabel("就绪")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(self.status_label)
+        main_layout.addStretch()
+    
+    # ---- 特定配置页面：按需构建 ----
+    
+    def _build_db_page(self):
         # Page 0: MySQL/SQL Server (Database)
         self.page_db = QWidget()
         form_db = QFormLayout(self.page_db)
         self.dbname_input = QLineEdit()
         form_db.addRow("数据库名:", self.dbname_input)
-        
+        return self.page_db
+    
+    def _build_mongo_page(self):
         # Page 1: MongoDB (Auth Source)
         self.page_mongo = QWidget()
         form_mongo = QFormLayout(self.page_mongo)
         self.auth_source_input = QLineEdit("admin")
         form_mongo.addRow("Auth Source:", self.auth_source_input)
-        
+        return self.page_mongo
+    
+    def _build_oracle_page(self):
         # Page 2: Oracle (Service Name / SID)
         self.page_oracle = QWidget()
         oracle_layout = QVBoxLayout(self.page_oracle)
@@ -185,7 +402,9 @@ class ConnectionWizard(QWidget):
         form_oracle.addRow(self.oracle_label, self.oracle_value_input)
         oracle_layout.addLayout(form_oracle)
         oracle_layout.addStretch()
-        
+        return self.page_oracle
+    
+    def _build_redis_page(self):
         # Page 3: Redis (DB Index)
         self.page_redis = QWidget()
         form_redis = QFormLayout(self.page_redis)
@@ -197,58 +416,43 @@ class ConnectionWizard(QWidget):
         hint_redis = QLabel("💡 Redis 数据库索引范围 0-15")
         hint_redis.setStyleSheet("color: #6e6e6e; font-size: 11px;")
         form_redis.addRow("", hint_redis)
-        
+        return self.page_redis
+    
+    def _build_es_page(self):
         # Page 4: Elasticsearch (无额外配置，仅提示)
         self.page_es = QWidget()
         form_es = QFormLayout(self.page_es)
         hint_es = QLabel("💡 Elasticsearch 使用 HTTP 协议连接\n如需身份验证，请填写用户名和密码")
         hint_es.setStyleSheet("color: #6e6e6e; font-size: 11px;")
         form_es.addRow("", hint_es)
-        
-        self.specific_stack.addWidget(self.page_db)      # 0
-        self.specific_stack.addWidget(self.page_mongo)   # 1
-        self.specific_stack.addWidget(self.page_oracle)  # 2
-        self.specific_stack.addWidget(self.page_redis)   # 3
-        self.specific_stack.addWidget(self.page_es)      # 4
-        
-        config_layout.addWidget(self.specific_stack)
-        main_layout.addWidget(config_group)
-        
-        # 按钮
-        btn_layout = QHBoxLayout()
-        self.import_btn = QPushButton("📂 导入 YAML")
-        self.import_btn.setToolTip("从 application.yml 或配置文件导入")
-        self.import_btn.clicked.connect(self._on_import_yaml)
-        self.import_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #238636;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #2ea043; }
-        """)
-        
-        self.test_btn = QPushButton("🚀 测试连接")
-        self.test_btn.clicked.connect(self._on_test)
-        self.save_btn = QPushButton("💾 保存")
-        self.save_btn.clicked.connect(self._on_save)
-        self.new_btn = QPushButton("➕ 新建")
-        self.new_btn.clicked.connect(self._on_new)
-        
-        btn_layout.addWidget(self.import_btn)
-        btn_layout.addWidget(self.test_btn)
-        btn_layout.addWidget(self.save_btn)
-        btn_layout.addWidget(self.new_btn)
-        btn_layout.addStretch()
-        main_layout.addLayout(btn_layout)
-        
-        # 状态
-        self.status_label = QLabel("就绪")
-        self.status_label.setAlignment(Qt.AlignCenter)
-        main_layout.addWidget(self.status_label)
-        main_layout.addStretch()
+        return self.page_es
+    
+    # 页面索引 -> 构建函数
+    _PAGE_BUILDERS = {
+        0: _build_db_page,
+        1: _build_mongo_page,
+        2: _build_oracle_page,
+        3: _build_redis_page,
+        4: _build_es_page,
+    }
+    
+    def _ensure_page(self, index: int):
+        """首次使用某个页面时构建并替换占位控件"""
+        if index in self._built_pages:
+            return
+        # 插入/移除会移动当前页，替换完成后恢复原来的页面索引
+        current = self.specific_stack.currentIndex()
+        placeholder = self.specific_stack.widget(index)
+        self.specific_stack.insertWidget(index, self._PAGE_BUILDERS[index](self))
+        self.specific_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.specific_stack.setCurrentIndex(current)
+        self._built_pages.add(index)
+    
+    def _show_page(self, index: int):
+        """切换到特定配置页面（必要时先构建）"""
+        self._ensure_page(index)
+        self.specific_stack.setCurrentIndex(index)
     
     def _on_oracle_mode_changed(self):
         if self.service_radio.isChecked():
@@ -258,7 +462,65 @@ class ConnectionWizard(QWidget):
             self.oracle_label.setText("SID:")
             self.oracle_value_input.setPlaceholderText("orcl")
     
+    # ---- 各数据库类型的特定配置：加载到表单 / 从表单读取 ----
+    
+    def _load_database(self, p):
+        self.dbname_input.setText(p.get("database", ""))
+    
+    def _save_database(self, data):
+        data["database"] = self.dbname_input.text().strip()
+    
+    def _load_mongo(self, p):
+        self.auth_source_input.setText(p.get("auth_source", "admin"))
+    
+    def _save_mongo(self, data):
+        data["auth_source"] = self.auth_source_input.text().strip() or "admin"
+    
+    def _load_oracle(self, p):
+        mode = p.get("oracle_mode", "service_name")
+        if mode == "sid":
+            self.sid_radio.setChecked(True)
+        else:
+            self.service_radio.setChecked(True)
+        self.oracle_value_input.setText(p.get("oracle_value", "ORCL"))
+    
+    def _save_oracle(self, data):
+        data["oracle_mode"] = "sid" if self.sid_radio.isChecked() else "service_name"
+        data["oracle_value"] = self.oracle_value_input.text().strip() or "ORCL"
+        data["database"] = data["oracle_value"]
+    
+    def _load_redis(self, p):
+        try:
+            self.redis_db_spin.setValue(int(p.get("database", 0)))
+        except:
+            self.redis_db_spin.setValue(0)
+    
+    def _save_redis(self, data):
+        data["database"] = str(self.redis_db_spin.value())
+    
+    def _load_none(self, p):
+        pass
+    
+    def _save_none(self, data):
+        pass  # ES 不需要数据库名
+    
+    # db_type -> (特定配置页索引, 加载函数, 读取函数)
+    _DB_HANDLERS = {
+        "mysql": (0, _load_database, _save_database),          # Database Name
+        "mariadb": (0, _load_database, _save_database),
+        "sqlserver": (0, _load_database, _save_database),
+        "mongodb": (1, _load_mongo, _save_mongo),              # Auth Source
+        "oracle": (2, _load_oracle, _save_oracle),             # Service/SID
+        "redis": (3, _load_redis, _save_redis),                # DB Index
+        "elasticsearch": (4, _load_none, _save_none),          # ES Hint
+    }
+    
     def _on_db_type_changed(self, index):
+        # 不直接连接 QTimer.start，否则 index 会被当作 start(msec) 的参数
+        self._db_type_timer.start()
+    
+    def _apply_db_type_change(self):
+        """按当前选中的类型更新端口和特定配置页面（由防抖定时器触发）"""
         db_type = self.type_combo.currentData()
         if not db_type:
             return
@@ -267,120 +529,126 @@ class ConnectionWizard(QWidget):
         self.port_input.setValue(self.DEFAULT_PORTS.get(db_type, 3306))
         
         # 切换页面
-        if db_type in ["mysql", "mariadb", "sqlserver"]:
-            self.specific_stack.setCurrentIndex(0)  # Database Name
-        elif db_type == "mongodb":
-            self.specific_stack.setCurrentIndex(1)  # Auth Source
-        elif db_type == "oracle":
-            self.specific_stack.setCurrentIndex(2)  # Service/SID
-        elif db_type == "redis":
-            self.specific_stack.setCurrentIndex(3)  # DB Index
-        elif db_type == "elasticsearch":
-            self.specific_stack.setCurrentIndex(4)  # ES Hint
+        handler = self._DB_HANDLERS.get(db_type)
+        if handler:
+            self._show_page(handler[0])
     
     def _apply_styles(self):
-        self.setStyleSheet("""
-            QWidget { background-color: #1e1e1e; color: #cccccc; }
-            QLineEdit, QComboBox {
-                background-color: #3c3c3c;
-                border: 1px solid #3c3c3c;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton {
-                background-color: #0e639c;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #1177bb; }
-            QGroupBox {
-                border: 1px solid #333;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-            }
-        """)
+        self.setStyleSheet(_WIZARD_STYLESHEET)
         
         # 为配置管理按钮设置统一样式
-        btn_style = """
-            QPushButton {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #505050;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #6e6e6e;
-            }
-            QPushButton:pressed {
-                background-color: #094771;
-                color: white;
-            }
-        """
-        self.refresh_btn.setStyleSheet(btn_style)
-        self.delete_btn.setStyleSheet(btn_style)
+        self.refresh_btn.setStyleSheet(_PROFILE_BUTTON_STYLE)
+        self.delete_btn.setStyleSheet(_PROFILE_BUTTON_STYLE)
         # 清空按钮已在创建时设置了红色样式
     
     def _load_profiles(self):
-        self.profile_combo.clear()
-        self.profile_combo.addItem("-- 选择配置 --", None)
-        profiles = self.connection_manager.load_profiles()
-        for p in profiles:
-            name = p.get("name", "")
-            db_type = p.get("db_type", "")
-            self.profile_combo.addItem(f"{name} ({db_type})", p)
+        # 上一次加载若尚未结束不必等待：替换 self.profile_loader 后，
+        # 旧线程的结果会被 _on_profiles_loaded 忽略，线程结束后自行释放（关闭窗口时等待）
+        
+        # 清空期间屏蔽 currentIndexChanged，避免触发 _on_profile_selected
+        with QSignalBlocker(self.profile_combo):
+            self.profile_combo.clear()
+            self.profile_combo.addItem("-- 选择配置 --", None)
+        self._profiles_by_name = {}
+        
+        # 后台读取配置，分批追加到下拉框
+        self.profile_loader = ProfileLoaderWorker(self.connection_manager, parent=self)
+        self.profile_loader.profiles_loaded.connect(self._on_profiles_loaded)
+        self.profile_loader.finished.connect(self._on_profiles_load_finished)
+        self.profile_loader.finished.connect(self._on_loader_thread_finished)
+        self._profile_loaders.append(self.profile_loader)
+        self.profile_loader.start()
+    
+    def _on_profiles_loaded(self, profiles: list):
+        # 忽略上一次加载残留在事件队列中的信号
+        if self.sender() is not self.profile_loader:
+            return
+        self._add_profiles(profiles)
+    
+    def _on_profiles_load_finished(self):
+        if self.sender() is not self.profile_loader:
+            return
+        self.profile_loader = None
+        self.profile_combo.finish_loading()
+    
+    def _on_loader_thread_finished(self):
+        # 加载线程退出后移出跟踪列表并释放
+        loader = self.sender()
+        if loader in self._profile_loaders:
+            self._profile_loaders.remove(loader)
+        loader.deleteLater()
+    
+    def _refresh_profiles(self, select: str = ""):
+        """
+        保存/删除后立即重新填充配置列表
+        
+        连接管理器在写入后已更新缓存，这里同步读取即可，不经过后台线程
+        
+        Args:
+            select: 填充后选中的配置名称（为空则停留在占位项）
+        """
+        # 丢弃仍在进行的后台加载结果
+        self.profile_loader = None
+        with QSignalBlocker(self.profile_combo):
+            self.profile_combo.clear()
+            self.profile_combo.addItem("-- 选择配置 --", None)
+            self._profiles_by_name = {}
+            self._add_profiles(self.connection_manager.load_profiles())
+            if select:
+                self.profile_combo.setCurrentIndex(max(0, self.profile_combo.findData(select)))
+        self.profile_combo.mark_loaded()
+        self.profile_combo.finish_loading()
+    
+    def _add_profiles(self, profiles: list):
+        """将一批配置追加到下拉框"""
+        names = [p.get("name", "") for p in profiles]
+        labels = [f"{name} ({p.get('db_type', '')})" for name, p in zip(names, profiles)]
+        self._profiles_by_name.update(zip(names, profiles))
+        
+        # 一次性追加整批条目，再逐行写入 userData（配置名称）
+        combo = self.profile_combo
+        start = combo.count()
+        combo.addItems(labels)
+        for row, name in enumerate(names, start):
+            combo.setItemData(row, name)
     
     def _on_profile_selected(self, index):
         if index <= 0:
             return
-        p = self.profile_combo.itemData(index)
+        p = self._profiles_by_name.get(self.profile_combo.itemData(index))
         if not p:
             return
         
-        self.name_input.setText(p.get("name", ""))
-        
-        db_type = p.get("db_type", "mysql")
-        idx = self.type_combo.findData(db_type)
-        if idx >= 0:
-            self.type_combo.setCurrentIndex(idx)
-        
-        self.host_input.setText(p.get("host", ""))
-        self.port_input.setValue(p.get("port", 3306))
-        self.username_input.setText(p.get("username", ""))
-        self.password_input.setText(p.get("password", ""))
-        
-        # 特定配置
-        if db_type in ["mysql", "mariadb", "sqlserver"]:
-            self.dbname_input.setText(p.get("database", ""))
-        elif db_type == "mongodb":
-            self.auth_source_input.setText(p.get("auth_source", "admin"))
-        elif db_type == "oracle":
-            mode = p.get("oracle_mode", "service_name")
-            if mode == "sid":
-                self.sid_radio.setChecked(True)
-            else:
-                self.service_radio.setChecked(True)
-            self.oracle_value_input.setText(p.get("oracle_value", "ORCL"))
-        elif db_type == "redis":
-            try:
-                self.redis_db_spin.setValue(int(p.get("database", 0)))
-            except:
-                self.redis_db_spin.setValue(0)
+        get = p.get
+        db_type = get("db_type", "mysql")
+        handler = self._DB_HANDLERS.get(db_type)
+        
+        # 屏蔽类型联动，避免先写入默认端口再被覆盖；同时取消尚未触发的类型切换
+        self._db_type_timer.stop()
+        with self._signals_blocked(self.type_combo, self.port_input):
+            self.name_input.setText(get("name", ""))
+            idx = self.type_combo.findData(db_type)
+            if idx >= 0:
+                self.type_combo.setCurrentIndex(idx)
+            self.host_input.setText(get("host", ""))
+            self.port_input.setValue(get("port", 3306))
+            self.username_input.setText(get("username", ""))
+            self.password_input.setText(get("password", ""))
+        
+        # 特定配置：手动切换页面并加载
+        if handler:
+            self._show_page(handler[0])
+            handler[1](self, p)
     
     def _on_delete_profile(self):
         index = self.profile_combo.currentIndex()
         if index <= 0:
             return
-        p = self.profile_combo.itemData(index)
-        name = p.get("name", "")
+        name = self.profile_combo.itemData(index)
         
         if QMessageBox.question(self, "确认", f"删除 \"{name}\"?") == QMessageBox.Yes:
             self.connection_manager.delete_profile(name)
-            self._load_profiles()
+            self._refresh_profiles()
             self._on_new()
     
     def _on_clear_all(self):
@@ -411,7 +679,7 @@ class ConnectionWizard(QWidget):
                 if name and self.connection_manager.delete_profile(name):
                     success_count += 1
             
-            self._load_profiles()
+            self._refresh_profiles()
             self._on_new()
             
             QMessageBox.information(
@@ -423,31 +691,18 @@ class ConnectionWizard(QWidget):
     def _get_form_data(self):
         db_type = self.type_combo.currentData()
         
-        data = {
-            "name": self.name_input.text().strip(),
-            "db_type": db_type,
-            "host": self.host_input.text().strip(),
-            "port": self.port_input.value(),
-            "username": self.username_input.text().strip(),
-            "password": self.password_input.text(),
-            "database": "",
-            "auth_source": "",
-            "oracle_mode": "",
-            "oracle_value": ""
-        }
-        
-        if db_type in ["mysql", "mariadb", "sqlserver"]:
-            data["database"] = self.dbname_input.text().strip()
-        elif db_type == "mongodb":
-            data["auth_source"] = self.auth_source_input.text().strip() or "admin"
-        elif db_type == "oracle":
-            data["oracle_mode"] = "sid" if self.sid_radio.isChecked() else "service_name"
-            data["oracle_value"] = self.oracle_value_input.text().strip() or "ORCL"
-            data["database"] = data["oracle_value"]
-        elif db_type == "redis":
-            data["database"] = str(self.redis_db_spin.value())
-        elif db_type == "elasticsearch":
-            data["database"] = ""  # ES 不需要数据库名
+        data = self._FORM_TEMPLATE.copy()
+        data["name"] = self.name_input.text().strip()
+        data["db_type"] = db_type
+        data["host"] = self.host_input.text().strip()
+        data["port"] = self.port_input.value()
+        data["username"] = self.username_input.text().strip()
+        data["password"] = self.password_input.text()
+        
+        handler = self._DB_HANDLERS.get(db_type)
+        if handler:
+            self._ensure_page(handler[0])
+            handler[2](self, data)
         
         return data
     
@@ -457,27 +712,29 @@ class ConnectionWizard(QWidget):
             QMessageBox.warning(self, "提示", "请输入配置名称")
             return
         
-        if self.test_worker and self.test_worker.is_running():
-            self.test_worker.stop()
+        # 测试期间按钮禁用，不会出现同一任务重复提交
+        if self.test_worker.is_running():
+            return
         
         self.test_btn.setEnabled(False)
-        self.test_btn.setText("测试中...")
+        self.test_btn.setText(self._TEST_RUNNING)
         self.status_label.setText("连接中...")
         
-        self.test_worker = DBTestWorker(profile, parent=self)
-        self.test_worker.success_signal.connect(
-            lambda msg: (self.status_label.setText("✓ 成功"), 
-                        QMessageBox.information(self, "成功", msg),
-                        self.test_btn.setEnabled(True),
-                        self.test_btn.setText("🚀 测试连接"))
-        )
-        self.test_worker.error_signal.connect(
-            lambda msg: (self.status_label.setText("✗ 失败"),
-                        QMessageBox.warning(self, "失败", msg),
-                        self.test_btn.setEnabled(True),
-                        self.test_btn.setText("🚀 测试连接"))
-        )
-        self.test_worker.start()
+        self.test_worker.start(profile)
+    
+    def _on_test_success(self, msg: str):
+        self.status_label.setText("✓ 成功")
+        QMessageBox.information(self, "成功", msg)
+        self._reset_test_button()
+    
+    def _on_test_error(self, msg: str):
+        self.status_label.setText("✗ 失败")
+        QMessageBox.warning(self, "失败", msg)
+        self._reset_test_button()
+    
+    def _reset_test_button(self):
+        self.test_btn.setEnabled(True)
+        self.test_btn.setText(self._TEST_READY)
     
     def _on_save(self):
         profile = self._get_form_data()
@@ -486,25 +743,60 @@ class ConnectionWizard(QWidget):
             return
         
         if self.connection_manager.save_profile(**profile):
+            self._refresh_profiles(select=profile["name"])
             QMessageBox.information(self, "成功", "配置已保存")
-            self._load_profiles()
         else:
             QMessageBox.warning(self, "失败", "保存失败")
     
+    @contextmanager
+    def _signals_blocked(self, *widgets):
+        """在 with 块内屏蔽多个控件的信号"""
+        blockers = [QSignalBlocker(w) for w in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+    
     def _on_new(self):
-        self.profile_combo.setCurrentIndex(0)
-        self.name_input.clear()
-        self.type_combo.setCurrentIndex(0)
-        self.host_input.setText("localhost")
-        self.port_input.setValue(3306)
-        self.username_input.clear()
-        self.password_input.clear()
-        self.dbname_input.clear()
-        self.auth_source_input.setText("admin")
-        self.service_radio.setChecked(True)
-        self.oracle_value_input.setText("ORCL")
+        # 批量重置期间暂停重绘并屏蔽各控件的变更信号，避免逐个触发联动槽函数
+        self.setUpdatesEnabled(False)
+        try:
+            self._reset_form()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
         self.status_label.setText("新建配置")
     
+    def _reset_form(self):
+        """将表单恢复为默认值（调用方负责暂停重绘）"""
+        with self._signals_blocked(
+            self.profile_combo, self.name_input, self.type_combo,
+            self.host_input, self.port_input, self.username_input,
+            self.password_input, self.dbname_input
+        ):
+            self.profile_combo.setCurrentIndex(0)
+            self.name_input.clear()
+            self.type_combo.setCurrentIndex(0)
+            self.host_input.setText("localhost")
+            self.port_input.setValue(3306)
+            self.username_input.clear()
+            self.password_input.clear()
+            self.dbname_input.clear()
+        
+        # 尚未构建的页面创建时即为默认值，只需重置已构建的页面
+        if 1 in self._built_pages:
+            self.auth_source_input.setText("admin")
+        if 2 in self._built_pages:
+            with self._signals_blocked(self.service_radio, self.sid_radio, self.oracle_value_input):
+                self.service_radio.setChecked(True)
+                self.oracle_value_input.setText("ORCL")
+            self._on_oracle_mode_changed()
+        
+        # 被屏蔽的类型联动手动执行一次
+        self._db_type_timer.stop()
+        self._show_page(self._DB_HANDLERS[self.type_combo.currentData()][0])
+    
     def _on_import_yaml(self):
         """
         批量导入 YAML 配置
@@ -565,8 +857,8 @@ class ConnectionWizard(QWidget):
                     failed_count += 1
                     failed_names.append(f"{name}({str(e)[:30]})")
             
-            # 刷新配置列表
-            self._load_profiles()
+            # 立即刷新配置列表
+            self._refresh_profiles()
             
             # 构建结果消息
             summary = importer.get_summary()
@@ -606,6 +898,13 @@ class ConnectionWizard(QWidget):
                 f"无法解析配置文件:\n{str(e)}"
             )
 
+    
+    def closeEvent(self, event) -> None:
+        """关闭时等待仍在运行的配置加载线程（子线程运行中被销毁会导致崩溃）"""
+        for loader in self._profile_loaders:
+            loader.wait()
+        event.accept()
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
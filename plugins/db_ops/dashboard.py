@@ -19,6 +19,8 @@
 """
 
 import sys
+import time
+from functools import lru_cache, partial
 from pathlib import Path
 
 # 添加项目根目录到路径
@@ -34,7 +36,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
     QMessageBox,
-    QTextEdit,
+    QPlainTextEdit,
     QGroupBox,
     QFrame,
     QLineEdit,
@@ -42,15 +44,16 @@ from PySide6.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
     QAbstractItemView,
+    QHeaderView,
     QSplitter,
     QStackedWidget,
     QApplication,
     QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QFont, QKeySequence, QShortcut
 
-from core.managers.connection_manager import ConnectionManager
+from core.managers.connection_manager import get_connection_manager
 from core.strategies.db_ops import (
     get_supported_operations,
     is_capability_supported,
@@ -59,6 +62,223 @@ from core.strategies.db_ops import (
 from core.strategies.sql_registry import SQLRegistry
 from core.workers.db_ops_worker import DBOpsWorker
 from core.workers.datapump_worker import DataPumpWorker
+from core.workers.profile_loader import ProfileLoaderWorker
+
+
+@lru_cache(maxsize=None)
+def _cached_operations(db_type: str) -> tuple:
+    """按数据库类型缓存支持的操作定义（能力表在运行期间不变）"""
+    return tuple(get_supported_operations(db_type))
+
+
+@lru_cache(maxsize=None)
+def _cached_capability_names(db_type: str) -> tuple:
+    """按数据库类型缓存已支持的能力名称"""
+    return tuple(k for k, v in get_db_capabilities(db_type).items() if v)
+
+
+# 最近一次加载到的连接配置快照（各仪表盘实例共用），打开时先用它填充下拉框
+_PROFILE_CACHE: list = None
+
+# 结果日志最多保留的行数，超出后自动丢弃最早的行
+RESULT_MAX_LINES = 10000
+
+# 操作按钮通用样式
+_OP_BTN_STYLE = """
+    QPushButton {
+        background-color: #2d2d30;
+        color: #cccccc;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+        padding: 12px 20px;
+        font-size: 13px;
+        min-width: 140px;
+        text-align: left;
+    }
+    QPushButton:hover {
+        background-color: #3c3c3c;
+        border-color: #505050;
+    }
+    QPushButton:pressed {
+        background-color: #094771;
+        border-color: #007acc;
+    }
+"""
+
+# 分组框样式（设置在仪表盘上，所有分组框共用）
+_GROUPBOX_STYLE = """
+    QGroupBox {
+        color: #cccccc;
+        border: 1px solid #333333;
+        border-radius: 4px;
+        margin-top: 12px;
+        padding-top: 12px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+    }
+"""
+
+# 连接选择下拉框样式
+_COMBO_STYLE = """
+    QComboBox {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-size: 13px;
+        min-height: 20px;
+    }
+    QComboBox:focus {
+        border: 1px solid #007acc;
+    }
+    QComboBox::drop-down {
+        border: none;
+        width: 24px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        border: 1px solid #454545;
+        selection-background-color: #094771;
+    }
+"""
+
+# 连接按钮样式
+_CONN_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #0e639c;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        padding: 0 20px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1177bb;
+    }
+    QPushButton:pressed {
+        background-color: #094771;
+    }
+"""
+
+# 运维操作按钮样式（设置在 ops_group 上，由其中的按钮继承）
+_OPS_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #2d2d30;
+        color: #cccccc;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+        padding: 10px 15px;
+        font-size: 13px;
+        text-align: center;
+    }
+    QPushButton:hover {
+        background-color: #3c3c3c;
+        border-color: #0e639c;
+    }
+    QPushButton:pressed {
+        background-color: #0e639c;
+        color: #ffffff;
+    }
+"""
+
+# 危险操作按钮（Impdp）样式
+_DANGER_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #c75450;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        padding: 0 20px;
+        font-size: 13px;
+    }
+    QPushButton:hover {
+        background-color: #d96864;
+    }
+    QPushButton:pressed {
+        background-color: #a0403d;
+    }
+    QPushButton:disabled {
+        background-color: #3c3c3c;
+        color: #6e6e6e;
+    }
+"""
+
+# 输入框样式
+_INPUT_STYLE = """
+    QLineEdit {
+        background-color: #3c3c3c;
+        color: #cccccc;
+        border: 1px solid #3c3c3c;
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-size: 13px;
+    }
+    QLineEdit:focus {
+        border: 1px solid #007acc;
+    }
+"""
+
+# 结果文本区样式
+_RESULT_TEXT_STYLE = """
+    QPlainTextEdit {
+        background-color: #1e1e1e;
+        color: #d4d4d4;
+        border: 1px solid #333333;
+        border-radius: 4px;
+        padding: 12px;
+        font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+        font-size: 12px;
+    }
+"""
+
+# 结果表格样式
+_RESULT_TABLE_STYLE = """
+    QTableWidget {
+        background-color: #1e1e1e;
+        border: 1px solid #333333;
+        border-radius: 4px;
+        gridline-color: #333333;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 12px;
+    }
+    QTableWidget::item {
+        padding: 6px 10px;
+        color: #d4d4d4;
+        border-bottom: 1px solid #2d2d2d;
+    }
+    QTableWidget::item:selected {
+        background-color: #094771;
+        color: #ffffff;
+    }
+    QTableWidget::item:alternate {
+        background-color: #252526;
+    }
+    QHeaderView::section {
+        background-color: #2d2d30;
+        color: #cccccc;
+        padding: 8px 10px;
+        border: none;
+        border-right: 1px solid #3c3c3c;
+        border-bottom: 1px solid #3c3c3c;
+        font-weight: bold;
+    }
+"""
+
+# 状态栏样式
+_STATUS_FRAME_STYLE = """
+    QFrame {
+        background-color: #252526;
+        border-top: 1px solid #333333;
+        border-radius: 4px;
+    }
+"""
 
 
 class DatabaseOpsWidget(QWidget):
@@ -76,7 +296,7 @@ class DatabaseOpsWidget(QWidget):
     | 路径: [/path/to/dmp ▼] [浏览]            |
     | [📤 Expdp 导出] [📥 Impdp 导入]          |
     +------------------------------------------+
-    | 结果显示区 (QTextEdit / QTableWidget)    |
+    | 结果显示区 (QPlainTextEdit / QTableWidget)|
     +------------------------------------------+
     """
     
@@ -84,13 +304,31 @@ class DatabaseOpsWidget(QWidget):
         super().__init__(parent)
         
         self.title_text = title
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = get_connection_manager()
         self.current_profile: dict = None
         self.current_db_type: str = ""
         
         # 工作线程
         self.db_worker: DBOpsWorker = None
         self.datapump_worker: DataPumpWorker = None
+        self.profile_loader: ProfileLoaderWorker = None
+        
+        # 连接配置：后台读取的结果、显示文本索引、当前下拉框中显示的列表（None 表示尚未填充）
+        self._loaded_profiles: list = []
+        self._profile_index: dict = {}
+        self._shown_profiles: list = None
+        
+        # DMP 文件名选择对话框（首次使用时创建）
+        self._dmp_dialog: QFileDialog = None
+        
+        # 当前查询的表格结果是否已开始分批填充
+        self._table_streaming = False
+        
+        # 滚动到底部合并到事件循环的下一轮执行，同一轮内多次追加只滚动一次
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(0)
+        self._scroll_timer.timeout.connect(self._flush_scroll)
         
         self._setup_ui()
         self._apply_styles()
@@ -102,6 +340,9 @@ class DatabaseOpsWidget(QWidget):
         main_layout.setContentsMargins(20, 20, 20, 20)
         main_layout.setSpacing(15)
         
+        # 分组框样式统一设置在仪表盘上，由各分组框继承
+        self.setStyleSheet(_GROUPBOX_STYLE)
+        
         # ========== 标题区 ==========
         title_label = QLabel(f"🖥️ {self.title_text}")
         title_font = QFont()
@@ -117,21 +358,6 @@ class DatabaseOpsWidget(QWidget):
         
         # ========== 连接选择区 ==========
         conn_group = QGroupBox("数据库连接")
-        conn_group.setStyleSheet("""
-            QGroupBox {
-                color: #cccccc;
-                border: 1px solid #333333;
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 12px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-        """)
         
         conn_layout = QHBoxLayout(conn_group)
         conn_layout.setSpacing(10)
@@ -175,7 +401,8 @@ class DatabaseOpsWidget(QWidget):
         
         # 操作按钮区
         self.ops_group = QGroupBox("运维操作")
-        self.ops_group.setStyleSheet(conn_group.styleSheet())
+        # 操作按钮的样式设置在分组框上，动态创建的按钮直接继承
+        self.ops_group.setStyleSheet(_OPS_BUTTON_STYLE)
         self.ops_layout = QGridLayout(self.ops_group)
         self.ops_layout.setSpacing(10)
         self.ops_layout.setContentsMargins(15, 20, 15, 15)
@@ -186,11 +413,97 @@ class DatabaseOpsWidget(QWidget):
         self.ops_hint.setAlignment(Qt.AlignCenter)
         self.ops_layout.addWidget(self.ops_hint, 0, 0, 1, 4)
         
+        # 操作按钮在切换连接时复用，仅按需增加
+        self._op_button_pool: list = []
+        self._ops_stretch_row = 0
+        
         ops_layout.addWidget(self.ops_group)
         
-        # Oracle 数据泵区（默认隐藏）
+        # Oracle 数据泵区：首次连接 Oracle 时才构建（见 _ensure_pump_group）
+        self.pump_group: QGroupBox = None
+        self._ops_container_layout = ops_layout
+        
+        ops_layout.addStretch()
+        
+        self.splitter.addWidget(ops_widget)
+        
+        # ---------- 结果区 (使用 QStackedWidget) ----------
+        result_widget = QWidget()
+        result_layout = QVBoxLayout(result_widget)
+        result_layout.setContentsMargins(0, 0, 0, 0)
+        result_layout.setSpacing(10)
+        
+        # 结果标签和工具栏
+        result_header = QHBoxLayout()
+        self.result_label = QLabel("操作结果")
+        self.result_label.setStyleSheet("color: #969696; font-weight: bold;")
+        result_header.addWidget(self.result_label)
+        
+        # 显示模式标签
+        self.result_mode_label = QLabel("[文本模式]")
+        self.result_mode_label.setStyleSheet("color: #569cd6; font-size: 11px;")
+        self.result_mode_label.setVisible(False)
+        result_header.addWidget(self.result_mode_label)
+        
+        result_header.addStretch()
+        
+        # 清除结果按钮
+        self.clear_result_btn = QPushButton("🗑 清除")
+        self.clear_result_btn.setFixedHeight(28)
+        self.clear_result_btn.clicked.connect(self._clear_results)
+        result_header.addWidget(self.clear_result_btn)
+        
+        result_layout.addLayout(result_header)
+        
+        # QStackedWidget 用于切换文本/表格显示
+        self.result_stack = QStackedWidget()
+        
+        # Page 0: 文本结果显示
+        self.result_text = QPlainTextEdit()
+        self.result_text.setReadOnly(True)
+        self.result_text.setPlaceholderText("操作结果将在此显示...\n\n点击上方运维按钮执行查询")
+        self.result_text.setMouseTracking(False)
+        self.result_text.setMaximumBlockCount(RESULT_MAX_LINES)
+        self.result_stack.addWidget(self.result_text)
+        
+        # Page 1: 表格结果显示，首次需要表格时才构建（见 _ensure_result_table）
+        self.result_table: QTableWidget = None
+        
+        result_layout.addWidget(self.result_stack)
+        
+        self.splitter.addWidget(result_widget)
+        
+        # 设置分割比例
+        self.splitter.setSizes([350, 350])
+        
+        main_layout.addWidget(self.splitter, stretch=1)
+        
+        # ========== 状态栏 ==========
+        status_frame = QFrame()
+        status_frame.setStyleSheet(_STATUS_FRAME_STYLE)
+        # 状态栏只显示文字，不接收鼠标事件
+        status_frame.setAttribute(Qt.WA_TransparentForMouseEvents)
+        status_layout = QHBoxLayout(status_frame)
+        status_layout.setContentsMargins(15, 10, 15, 10)
+        
+        self.status_label = QLabel("就绪 - 请选择数据库连接")
+        self.status_label.setStyleSheet("color: #969696;")
+        status_layout.addWidget(self.status_label)
+        
+        status_layout.addStretch()
+        
+        self.db_type_label = QLabel("")
+        self.db_type_label.setStyleSheet("color: #6e6e6e;")
+        status_layout.addWidget(self.db_type_label)
+        
+        main_layout.addWidget(status_frame)
+    
+    def _ensure_pump_group(self) -> QGroupBox:
+        """获取 Oracle 数据泵区，首次调用时构建并插入操作区"""
+        if self.pump_group is not None:
+            return self.pump_group
+        
         self.pump_group = QGroupBox("Oracle 数据泵 (Data Pump)")
-        self.pump_group.setStyleSheet(conn_group.styleSheet())
         self.pump_group.setVisible(False)
         
         pump_layout = QVBoxLayout(self.pump_group)
@@ -252,281 +565,130 @@ class DatabaseOpsWidget(QWidget):
         self.impdp_btn = QPushButton("📥 Impdp 导入")
         self.impdp_btn.setFixedHeight(38)
         self.impdp_btn.setToolTip("执行 Oracle 数据泵导入 (impdp)⚠️ 将覆盖现有数据")
-        self.impdp_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c75450;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 0 20px;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #d96864;
-            }
-            QPushButton:pressed {
-                background-color: #a0403d;
-            }
-            QPushButton:disabled {
-                background-color: #3c3c3c;
-                color: #6e6e6e;
-            }
-        """)
+        self.impdp_btn.setStyleSheet(_DANGER_BUTTON_STYLE)
         self.impdp_btn.clicked.connect(self._on_impdp_click)
         pump_btn_layout.addWidget(self.impdp_btn)
         
         pump_btn_layout.addStretch()
         pump_layout.addLayout(pump_btn_layout)
         
-        ops_layout.addWidget(self.pump_group)
-        ops_layout.addStretch()
-        
-        self.splitter.addWidget(ops_widget)
+        # 样式
+        self.get_filename_btn.setStyleSheet(_OP_BTN_STYLE)
+        self.expdp_btn.setStyleSheet(_OP_BTN_STYLE)
+        self.impdp_btn.setStyleSheet(_OP_BTN_STYLE)
+        self.pump_file_input.setStyleSheet(_INPUT_STYLE)
         
-        # ---------- 结果区 (使用 QStackedWidget) ----------
-        result_widget = QWidget()
-        result_layout = QVBoxLayout(result_widget)
-        result_layout.setContentsMargins(0, 0, 0, 0)
-        result_layout.setSpacing(10)
-        
-        # 结果标签和工具栏
-        result_header = QHBoxLayout()
-        self.result_label = QLabel("操作结果")
-        self.result_label.setStyleSheet("color: #969696; font-weight: bold;")
-        result_header.addWidget(self.result_label)
-        
-        # 显示模式标签
-        self.result_mode_label = QLabel("[文本模式]")
-        self.result_mode_label.setStyleSheet("color: #569cd6; font-size: 11px;")
-        self.result_mode_label.setVisible(False)
-        result_header.addWidget(self.result_mode_label)
-        
-        result_header.addStretch()
-        
-        # 清除结果按钮
-        self.clear_result_btn = QPushButton("🗑 清除")
-        self.clear_result_btn.setFixedHeight(28)
-        self.clear_result_btn.clicked.connect(self._clear_results)
-        result_header.addWidget(self.clear_result_btn)
-        
-        result_layout.addLayout(result_header)
-        
-        # QStackedWidget 用于切换文本/表格显示
-        self.result_stack = QStackedWidget()
-        
-        # Page 0: 文本结果显示
-        self.result_text = QTextEdit()
-        self.result_text.setReadOnly(True)
-        self.result_text.setPlaceholderText("操作结果将在此显示...\n\n点击上方运维按钮执行查询")
-        self.result_stack.addWidget(self.result_text)
+        # 放在操作按钮区之后、弹性空间之前
+        self._ops_container_layout.insertWidget(1, self.pump_group)
+        return self.pump_group
+    
+    def _ensure_result_table(self) -> QTableWidget:
+        """获取结果表格，首次调用时构建并放入结果区第 1 页"""
+        if self.result_table is not None:
+            return self.result_table
         
-        # Page 1: 表格结果显示
         self.result_table = QTableWidget()
         self.result_table.setColumnCount(0)
         self.result_table.setRowCount(0)
         self.result_table.setAlternatingRowColors(True)
         self.result_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.result_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.result_table.setSortingEnabled(False)
+        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.result_table.horizontalHeader().setStretchLastSection(True)
         self.result_table.horizontalHeader().setDefaultSectionSize(120)
         self.result_table.verticalHeader().setDefaultSectionSize(25)
-        self.result_stack.addWidget(self.result_table)
-        
-        result_layout.addWidget(self.result_stack)
-        
-        self.splitter.addWidget(result_widget)
-        
-        # 设置分割比例
-        self.splitter.setSizes([350, 350])
-        
-        main_layout.addWidget(self.splitter, stretch=1)
-        
-        # ========== 状态栏 ==========
-        status_frame = QFrame()
-        status_frame.setStyleSheet("""
-            QFrame {
-                background-color: #252526;
-                border-top: 1px solid #333333;
-                border-radius: 4px;
-            }
-        """)
-        status_layout = QHBoxLayout(status_frame)
-        status_layout.setContentsMargins(15, 10, 15, 10)
         
-        self.status_label = QLabel("就绪 - 请选择数据库连接")
-        self.status_label.setStyleSheet("color: #969696;")
-        status_layout.addWidget(self.status_label)
-        
-        status_layout.addStretch()
+        # 单元格样式不使用 :hover，关闭鼠标跟踪和悬停事件
+        self.result_table.setMouseTracking(False)
+        self.result_table.viewport().setMouseTracking(False)
+        self.result_table.setAttribute(Qt.WA_Hover, False)
+        self.result_table.viewport().setAttribute(Qt.WA_Hover, False)
         
-        self.db_type_label = QLabel("")
-        self.db_type_label.setStyleSheet("color: #6e6e6e;")
-        status_layout.addWidget(self.db_type_label)
+        # 样式
+        self.result_table.setStyleSheet(_RESULT_TABLE_STYLE)
         
-        main_layout.addWidget(status_frame)
+        self.result_stack.insertWidget(1, self.result_table)
+        return self.result_table
     
     def _apply_styles(self) -> None:
         """应用深色主题样式"""
         # 连接选择下拉框
-        self.conn_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 13px;
-                min-height: 20px;
-            }
-            QComboBox:focus {
-                border: 1px solid #007acc;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 24px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #454545;
-                selection-background-color: #094771;
-            }
-        """)
+        self.conn_combo.setStyleSheet(_COMBO_STYLE)
         
         # 按钮样式
-        self.connect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0e639c;
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 0 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1177bb;
-            }
-            QPushButton:pressed {
-                background-color: #094771;
-            }
-        """)
-        
-        # 操作按钮通用样式
-        op_btn_style = """
-            QPushButton {
-                background-color: #2d2d30;
-                color: #cccccc;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                padding: 12px 20px;
-                font-size: 13px;
-                min-width: 140px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #3c3c3c;
-                border-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #094771;
-                border-color: #007acc;
-            }
-        """
-        self.get_filename_btn.setStyleSheet(op_btn_style)
-        self.expdp_btn.setStyleSheet(op_btn_style)
-        self.impdp_btn.setStyleSheet(op_btn_style)
-        self.clear_result_btn.setStyleSheet(op_btn_style)
-        
-        # 数据泵输入框
-        self.pump_file_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #cccccc;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #007acc;
-            }
-        """)
+        self.connect_btn.setStyleSheet(_CONN_BUTTON_STYLE)
+        
+        # 操作按钮通用样式（数据泵区按钮在 _ensure_pump_group 中设置）
+        self.clear_result_btn.setStyleSheet(_OP_BTN_STYLE)
         
         # QStackedWidget 无特殊样式
         
         # 结果显示区
-        self.result_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #d4d4d4;
-                border: 1px solid #333333;
-                border-radius: 4px;
-                padding: 12px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
-        
-        # 结果表格
-        self.result_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1e1e1e;
-                border: 1px solid #333333;
-                border-radius: 4px;
-                gridline-color: #333333;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 12px;
-            }
-            QTableWidget::item {
-                padding: 6px 10px;
-                color: #d4d4d4;
-                border-bottom: 1px solid #2d2d2d;
-            }
-            QTableWidget::item:selected {
-                background-color: #094771;
-                color: #ffffff;
-            }
-            QTableWidget::item:alternate {
-                background-color: #252526;
-            }
-            QHeaderView::section {
-                background-color: #2d2d30;
-                color: #cccccc;
-                padding: 8px 10px;
-                border: none;
-                border-right: 1px solid #3c3c3c;
-                border-bottom: 1px solid #3c3c3c;
-                font-weight: bold;
-            }
-        """)
+        self.result_text.setStyleSheet(_RESULT_TEXT_STYLE)
     
     def _load_connections(self) -> None:
-        """加载已保存的数据库连接"""
+        """
+        加载已保存的数据库连接
+        
+        若已有上次加载的快照则先立即显示，再在后台线程重新读取，
+        结果有变化时才重新填充下拉框
+        """
+        if self.profile_loader and self.profile_loader.isRunning():
+            return
+        
+        if _PROFILE_CACHE is not None and self._shown_profiles is None:
+            self._populate_connections(_PROFILE_CACHE)
+        
+        self.refresh_list_btn.setEnabled(False)
+        self.status_label.setText("正在加载连接配置...")
+        
+        self._loaded_profiles = []
+        self.profile_loader = ProfileLoaderWorker(self.connection_manager, parent=self)
+        self.profile_loader.profiles_loaded.connect(self._on_profiles_batch)
+        self.profile_loader.finished.connect(self._on_profiles_loaded)
+        self.profile_loader.finished.connect(self.profile_loader.deleteLater)
+        self.profile_loader.start()
+    
+    def _on_profiles_batch(self, profiles: list) -> None:
+        """暂存后台线程分批读取到的连接配置"""
+        self._loaded_profiles.extend(profiles)
+    
+    def _on_profiles_loaded(self) -> None:
+        """连接配置加载完成，有变化时重新填充下拉框"""
+        global _PROFILE_CACHE
+        # 线程结束后会被 deleteLater 释放，不再保留引用
+        self.profile_loader = None
+        self.refresh_list_btn.setEnabled(True)
+        profiles = self._loaded_profiles
+        _PROFILE_CACHE = profiles
+        
+        if profiles != self._shown_profiles:
+            self._populate_connections(profiles)
+        self.status_label.setText(f"已加载 {len(profiles)} 个连接配置")
+    
+    def _populate_connections(self, profiles: list) -> None:
+        """用连接配置填充下拉框，并恢复之前的选择"""
+        self._shown_profiles = profiles
         current_text = self.conn_combo.currentText()
         
         self.conn_combo.clear()
         self.conn_combo.addItem("-- 请选择数据库连接 --", None)
         
         try:
-            profiles = self.connection_manager.load_profiles()
-            
-            for profile in profiles:
-                name = profile.get("name", "未命名")
-                db_type = profile.get("db_type", "unknown")
-                host = profile.get("host", "")
-                display = f"{name} [{db_type}]"
+            # 显示文本 -> 行号，用于恢复之前的选择
+            self._profile_index = {}
+            for row, profile in enumerate(profiles, 1):
+                display = f"{profile.get('name', '未命名')} [{profile.get('db_type', 'unknown')}]"
                 self.conn_combo.addItem(display, profile)
+                self._profile_index.setdefault(display, row)
             
             # 恢复之前的选择
             if current_text:
-                index = self.conn_combo.findText(current_text)
+                index = self._profile_index.get(current_text, -1)
                 if index >= 0:
                     self.conn_combo.setCurrentIndex(index)
             
-            count = len(profiles)
-            self.status_label.setText(f"已加载 {count} 个连接配置")
-            
         except Exception as e:
             self.status_label.setText(f"加载连接失败: {e}")
     
@@ -569,81 +731,76 @@ class DatabaseOpsWidget(QWidget):
         self._show_connection_info(profile)
     
     def _update_operation_buttons(self) -> None:
-        """根据数据库类型更新操作按钮"""
-        # 清除现有按钮
-        while self.ops_layout.count():
-            item = self.ops_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
+        """根据数据库类型更新操作按钮，期间暂停操作区重绘"""
+        self.ops_group.setUpdatesEnabled(False)
+        try:
+            self._fill_operation_buttons()
+        finally:
+            self.ops_group.setUpdatesEnabled(True)
+        self.ops_group.update()
+    
+    def _fill_operation_buttons(self) -> None:
+        """填充操作按钮（复用已创建的按钮，多余的隐藏）"""
         if not self.current_db_type:
-            self.ops_hint = QLabel("请先选择数据库连接")
-            self.ops_hint.setStyleSheet("color: #6e6e6e; padding: 30px;")
-            self.ops_hint.setAlignment(Qt.AlignCenter)
-            self.ops_layout.addWidget(self.ops_hint, 0, 0, 1, 4)
+            self._show_ops_hint("请先选择数据库连接", "#6e6e6e")
             return
         
         # 获取支持的操作
-        operations = get_supported_operations(self.current_db_type)
+        operations = _cached_operations(self.current_db_type)
         
         if not operations:
-            self.ops_hint = QLabel(f"数据库类型 '{self.current_db_type}' 暂无支持的操作")
-            self.ops_hint.setStyleSheet("color: #dcdcaa; padding: 30px;")
-            self.ops_hint.setAlignment(Qt.AlignCenter)
-            self.ops_layout.addWidget(self.ops_hint, 0, 0, 1, 4)
+            self._show_ops_hint(f"数据库类型 '{self.current_db_type}' 暂无支持的操作", "#dcdcaa")
             return
         
-        # 创建操作按钮
-        row, col = 0, 0
-        max_cols = 4
+        self.ops_hint.setVisible(False)
         
-        for op in operations:
-            btn = QPushButton(op["label"])
-            btn.setToolTip(f"{op['tooltip']}\n快捷键: {op.get('shortcut', '无')}")
-            btn.setFixedHeight(45)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.clicked.connect(lambda checked, op_id=op["id"]: self._on_operation_click(op_id))
-            
-            # 应用样式
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2d2d30;
-                    color: #cccccc;
-                    border: 1px solid #3c3c3c;
-                    border-radius: 4px;
-                    padding: 10px 15px;
-                    font-size: 13px;
-                    text-align: center;
-                }
-                QPushButton:hover {
-                    background-color: #3c3c3c;
-                    border-color: #0e639c;
-                }
-                QPushButton:pressed {
-                    background-color: #0e639c;
-                    color: #ffffff;
-                }
-            """)
-            
-            self.ops_layout.addWidget(btn, row, col)
+        # 按网格位置复用按钮，不足时再创建
+        max_cols = 4
+        pool = self._op_button_pool
+        for i, op in enumerate(operations):
+            if i < len(pool):
+                btn = pool[i]
+            else:
+                btn = QPushButton()
+                btn.setFixedHeight(45)
+                btn.setCursor(Qt.PointingHandCursor)
+                btn.clicked.connect(self._on_op_button_clicked)
+                self.ops_layout.addWidget(btn, i // max_cols, i % max_cols)
+                pool.append(btn)
             
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+            btn.setText(op["label"])
+            btn.setToolTip(f"{op['tooltip']}\n快捷键: {op.get('shortcut', '无')}")
+            btn.setProperty("op_id", op["id"])
+            btn.setVisible(True)
+        
+        for btn in pool[len(operations):]:
+            btn.setVisible(False)
         
-        # 添加弹性空间
-        self.ops_layout.setRowStretch(row + 1, 1)
+        # 弹性空间放在最后一行按钮之后（先清除上一次设置的行）
+        self.ops_layout.setRowStretch(self._ops_stretch_row, 0)
+        self._ops_stretch_row = len(operations) // max_cols + 1
+        self.ops_layout.setRowStretch(self._ops_stretch_row, 1)
+    
+    def _show_ops_hint(self, text: str, color: str) -> None:
+        """隐藏所有操作按钮，在操作区显示提示文字"""
+        for btn in self._op_button_pool:
+            btn.setVisible(False)
+        self.ops_hint.setText(text)
+        self.ops_hint.setStyleSheet(f"color: {color}; padding: 30px;")
+        self.ops_hint.setVisible(True)
+    
+    def _on_op_button_clicked(self) -> None:
+        """操作按钮点击 - 按钮对应的操作 ID 保存在 op_id 属性中"""
+        self._on_operation_click(self.sender().property("op_id"))
     
     def _update_oracle_pump_visibility(self) -> None:
         """更新 Oracle 数据泵区域可见性"""
-        if not self.current_db_type:
-            self.pump_group.setVisible(False)
-            return
-        
-        # 仅 Oracle 显示数据泵区域
+        # 仅 Oracle 显示数据泵区域（非 Oracle 连接无需构建）
         is_oracle = self.current_db_type.lower() == "oracle"
-        self.pump_group.setVisible(is_oracle)
+        if is_oracle:
+            self._ensure_pump_group().setVisible(True)
+        elif self.pump_group is not None:
+            self.pump_group.setVisible(False)
         
         if is_oracle:
             self.result_label.setText("操作结果 / 数据泵日志")
@@ -681,10 +838,13 @@ class DatabaseOpsWidget(QWidget):
         
         # 显示执行信息
         self._switch_result_mode(result_type)
-        self._log_message(f"[{self.current_db_type}] {description}")
-        self._log_message(f"操作: {operation_id}")
+        self._log_message(
+            f"[{self.current_db_type}] {description}",
+            f"操作: {operation_id}"
+        )
         
         # 创建并启动工作线程
+        self._table_streaming = False
         self.db_worker = DBOpsWorker(
             db_profile=self.current_profile,
             operation=operation_id,
@@ -695,25 +855,33 @@ class DatabaseOpsWidget(QWidget):
         )
         
         self.db_worker.result_signal.connect(
-            lambda status, data_type, content, meta: self._on_query_success(
-                status, data_type, content, meta, description
-            )
+            partial(self._on_query_success, description=description)
         )
+        self.db_worker.chunk_signal.connect(self._on_query_chunk)
         self.db_worker.error_signal.connect(self._on_query_error)
-        self.db_worker.finished_signal.connect(lambda: self._set_executing_state(False))
+        self.db_worker.finished_signal.connect(partial(self._set_executing_state, False))
         
         self.db_worker.start()
     
     def _on_select_dmp_filename(self) -> None:
         """选择 DMP 文件名（仅从本地路径提取文件名作为参考）"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "选择 DMP 文件名参考",
-            "",
-            "Oracle Dump Files (*.dmp);;All Files (*)",
-            options=QFileDialog.DontConfirmOverwrite
-        )
+        # 对话框只创建一次并重复使用，同时保留上次浏览的目录
+        if self._dmp_dialog is None:
+            self._dmp_dialog = QFileDialog(
+                self,
+                "选择 DMP 文件名参考",
+                "",
+                "Oracle Dump Files (*.dmp);;All Files (*)"
+            )
+            self._dmp_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            self._dmp_dialog.setOption(QFileDialog.DontConfirmOverwrite)
+            self._dmp_dialog.setOption(QFileDialog.DontUseNativeDialog)
         
+        self._dmp_dialog.selectFile(self.pump_file_input.text().strip())
+        if not self._dmp_dialog.exec():
+            return
+        
+        file_path = self._dmp_dialog.selectedFiles()[0]
         if file_path:
             # 仅提取文件名，不包含路径
             filename = Path(file_path).name
@@ -788,9 +956,11 @@ class DatabaseOpsWidget(QWidget):
         
         # 切换到文本模式显示日志
         self._switch_result_mode("text")
-        self._log_message(f"\n{'='*60}")
-        self._log_message(f"【Oracle 数据泵 {operation.upper()}】")
-        self._log_message(f"{'='*60}")
+        self._log_message(
+            f"\n{'='*60}",
+            f"【Oracle 数据泵 {operation.upper()}】",
+            f"{'='*60}"
+        )
         
         # 构建数据库配置
         db_config = {
@@ -818,21 +988,20 @@ class DatabaseOpsWidget(QWidget):
         self.datapump_worker.output_signal.connect(self._on_datapump_output)
         self.datapump_worker.error_signal.connect(self._on_datapump_error)
         self.datapump_worker.finished_signal.connect(
-            lambda exit_code, success: self._on_datapump_finished(exit_code, success, operation)
+            partial(self._on_datapump_finished, operation=operation)
         )
         
         self.datapump_worker.start()
     
     def _on_datapump_output(self, line: str) -> None:
         """数据泵实时输出"""
-        self.result_text.append(line)
+        self.result_text.appendPlainText(line)
         # 滚动到底部
-        scrollbar = self.result_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._scroll_timer.start()
     
     def _on_datapump_error(self, error_msg: str) -> None:
         """数据泵错误"""
-        self.result_text.append(f"\n[错误] {error_msg}")
+        self.result_text.appendPlainText(f"\n[错误] {error_msg}")
         self.status_label.setText("✗ 数据泵执行失败")
         self.status_label.setStyleSheet("color: #f48771;")
     
@@ -857,6 +1026,13 @@ class DatabaseOpsWidget(QWidget):
     
     def _show_connection_info(self, profile: dict) -> None:
         """显示连接信息"""
+        # 支持的操作列表
+        supported = _cached_capability_names(profile.get('db_type', ''))
+        if supported:
+            ops_block = "\n".join(f"  - {op}" for op in supported)
+        else:
+            ops_block = "  （暂无支持的操作）"
+        
         info = f"""
 连接信息:
   名称: {profile.get('name', 'N/A')}
@@ -866,16 +1042,8 @@ class DatabaseOpsWidget(QWidget):
   用户名: {profile.get('username', 'N/A')}
 
 支持的操作:
+{ops_block}
 """
-        # 添加支持的操作列表
-        caps = get_db_capabilities(profile.get('db_type', ''))
-        supported = [k for k, v in caps.items() if v]
-        if supported:
-            for op in supported:
-                info += f"  - {op}\n"
-        else:
-            info += "  （暂无支持的操作）\n"
-        
         self._log_message(info)
     
     def _switch_result_mode(self, mode: str) -> None:
@@ -889,6 +1057,7 @@ class DatabaseOpsWidget(QWidget):
             self.result_stack.setCurrentIndex(0)
             self.result_mode_label.setText("[文本模式]")
         else:
+            self._ensure_result_table()
             self.result_stack.setCurrentIndex(1)
             self.result_mode_label.setText("[表格模式]")
         self.result_mode_label.setVisible(True)
@@ -907,15 +1076,15 @@ class DatabaseOpsWidget(QWidget):
         if data_type == "text":
             # 文本结果显示
             self._switch_result_mode("text")
-            self.result_text.append(f"\n{'='*60}")
-            self.result_text.append(f"【{description}】")
-            self.result_text.append(f"{'='*60}\n")
-            self.result_text.append(str(content))
-            self.result_text.append(f"\n{'='*60}")
+            self.result_text.appendPlainText(f"\n{'='*60}")
+            self.result_text.appendPlainText(f"【{description}】")
+            self.result_text.appendPlainText(f"{'='*60}\n")
+            self.result_text.appendPlainText(str(content))
+            self.result_text.appendPlainText(f"\n{'='*60}")
             
             row_count = metadata.get("row_count", 0)
             elapsed_ms = metadata.get("elapsed_ms", 0)
-            self.result_text.append(f"行数: {row_count} | 耗时: {elapsed_ms}ms")
+            self.result_text.appendPlainText(f"行数: {row_count} | 耗时: {elapsed_ms}ms")
             
         else:  # table
             # 表格结果显示
@@ -924,17 +1093,13 @@ class DatabaseOpsWidget(QWidget):
             headers = metadata.get("columns", [])
             rows = content if isinstance(content, list) else []
             
-            # 设置表格
-            self.result_table.setColumnCount(len(headers))
-            self.result_table.setRowCount(len(rows))
-            self.result_table.setHorizontalHeaderLabels(headers)
+            # 设置表格（已分批推送过的结果只追加剩余行）
+            if not self._table_streaming:
+                self._reset_table(headers)
+            self._table_streaming = False
             
             # 填充数据
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, cell_value in enumerate(row_data):
-                    item = QTableWidgetItem(str(cell_value))
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    self.result_table.setItem(row_idx, col_idx, item)
+            self._append_table_rows(rows)
             
             # 调整列宽
             self.result_table.resizeColumnsToContents()
@@ -950,6 +1115,43 @@ class DatabaseOpsWidget(QWidget):
         self.status_label.setText(f"✓ {description} 完成 ({elapsed_ms}ms)")
         self.status_label.setStyleSheet("color: #4ec9b0;")
     
+    def _on_query_chunk(self, rows: list, headers: list) -> None:
+        """
+        表格分批结果回调
+        
+        Args:
+            rows: 本批数据行
+            headers: 列名
+        """
+        if not self._table_streaming:
+            self._switch_result_mode("table")
+            self._reset_table(headers)
+            self._table_streaming = True
+        
+        self._append_table_rows(rows)
+    
+    def _reset_table(self, headers: list) -> None:
+        """清空表格并设置列头"""
+        self.result_table.setRowCount(0)
+        self.result_table.setColumnCount(len(headers))
+        self.result_table.setHorizontalHeaderLabels(headers)
+    
+    def _append_table_rows(self, rows: list) -> None:
+        """追加数据行到表格末尾（填充期间暂停重绘）"""
+        table = self.result_table
+        start = table.rowCount()
+        
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(start + len(rows))
+            for row_idx, row_data in enumerate(rows, start):
+                for col_idx, cell_value in enumerate(row_data):
+                    item = QTableWidgetItem(str(cell_value))
+                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                    table.setItem(row_idx, col_idx, item)
+        finally:
+            table.setUpdatesEnabled(True)
+    
     def _on_query_error(self, error_msg: str, sql_text: str) -> None:
         """
         查询错误回调
@@ -959,15 +1161,15 @@ class DatabaseOpsWidget(QWidget):
             sql_text: 执行的 SQL
         """
         self._switch_result_mode("text")
-        self.result_text.append(f"\n{'='*60}")
-        self.result_text.append("【执行错误】")
-        self.result_text.append(f"{'='*60}\n")
-        self.result_text.append(error_msg)
-        self.result_text.append(f"\n{'='*60}")
+        self.result_text.appendPlainText(f"\n{'='*60}")
+        self.result_text.appendPlainText("【执行错误】")
+        self.result_text.appendPlainText(f"{'='*60}\n")
+        self.result_text.appendPlainText(error_msg)
+        self.result_text.appendPlainText(f"\n{'='*60}")
         
         # 限制 SQL 显示长度
         sql_display = sql_text[:500] + "..." if len(sql_text) > 500 else sql_text
-        self.result_text.append(f"\nSQL:\n{sql_display}")
+        self.result_text.appendPlainText(f"\nSQL:\n{sql_display}")
         
         self.status_label.setText("✗ 执行失败")
         self.status_label.setStyleSheet("color: #f48771;")
@@ -983,22 +1185,34 @@ class DatabaseOpsWidget(QWidget):
         self.connect_btn.setEnabled(not executing)
         self.conn_combo.setEnabled(not executing)
     
-    def _log_message(self, message: str) -> None:
-        """添加日志消息"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.result_text.append(f"[{timestamp}] {message}")
+    def _log_message(self, *messages: str) -> None:
+        """
+        添加日志消息（多条消息合并为一次插入）
+        
+        Args:
+            messages: 一条或多条消息，每条加上相同的时间戳前缀
+        """
+        t = time.localtime()
+        timestamp = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        text = "\n".join(f"[{timestamp}] {message}" for message in messages)
+        
+        self.result_text.appendPlainText(text)
         
         # 滚动到底部
+        self._scroll_timer.start()
+    
+    def _flush_scroll(self) -> None:
+        """将结果文本滚动到底部（由 _scroll_timer 触发）"""
         scrollbar = self.result_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
     def _clear_results(self) -> None:
         """清除结果"""
         self.result_text.clear()
-        self.result_table.clear()
-        self.result_table.setRowCount(0)
-        self.result_table.setColumnCount(0)
+        if self.result_table is not None:
+            self.result_table.clear()
+            self.result_table.setRowCount(0)
+            self.result_table.setColumnCount(0)
         self.result_label.setText("操作结果")
         self.result_mode_label.setVisible(False)
     
@@ -1010,18 +1224,11 @@ class DatabaseOpsWidget(QWidget):
         self.status_label.setText("就绪 - 请选择数据库连接")
         self.status_label.setStyleSheet("color: #969696;")
         
-        # 清除按钮
-        while self.ops_layout.count():
-            item = self.ops_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        self.ops_hint = QLabel("请先选择数据库连接")
-        self.ops_hint.setStyleSheet("color: #6e6e6e; padding: 30px;")
-        self.ops_hint.setAlignment(Qt.AlignCenter)
-        self.ops_layout.addWidget(self.ops_hint, 0, 0, 1, 4)
+        # 隐藏操作按钮，显示默认提示
+        self._update_operation_buttons()
         
-        self.pump_group.setVisible(False)
+        if self.pump_group is not None:
+            self.pump_group.setVisible(False)
     
     def closeEvent(self, event) -> None:
         """关闭时确保线程停止"""
@@ -1029,6 +1236,10 @@ class DatabaseOpsWidget(QWidget):
             self.db_worker.stop()
         if self.datapump_worker and self.datapump_worker.is_running():
             self.datapump_worker.stop()
+            # stop() 不再阻塞，关闭窗口前等待工作线程回收子进程
+            self.datapump_worker.wait()
+        if self.profile_loader and self.profile_loader.isRunning():
+            self.profile_loader.wait()
         event.accept()
 
 
@@ -34,7 +34,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from core.managers.connection_manager import ConnectionManager
+from core.managers.connection_manager import get_connection_manager
 from core.utils.db_tester import DBTestWorker
 
 
@@ -62,7 +62,7 @@ class DatabaseWizard(QWidget):
         self.default_port = default_port
         
         # 初始化连接管理器
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = get_connection_manager()
         
         # 测试线程
         self.test_worker: DBTestWorker = None
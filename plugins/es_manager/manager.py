@@ -28,8 +28,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QFont, QAction
 
-from core.managers.connection_manager import ConnectionManager
-from core.workers.es_worker import ESWorker, ESClient
+from core.managers.connection_manager import get_connection_manager
+from core.workers.es_worker import ESWorker, ESClient, get_es_client
 
 
 class JsonEditorDialog(QDialog):
@@ -156,8 +156,9 @@ class ESManagerWidget(QWidget):
         super().__init__(parent)
         
         self.title_text = title
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = get_connection_manager()
         self.es_worker: ESWorker = None
+        self._es_workers: list = []  # 本界面创建且可能仍在执行的全部 ESWorker
         self.es_client: ESClient = None
         
         # 状态
@@ -165,6 +166,7 @@ class ESManagerWidget(QWidget):
         self.current_page: int = 1
         self.page_size: int = 20
         self.total_docs: int = 0
+        self._page_cursors: dict = {}  # 页码 -> 加载该页所用的 search_after
         
         self._setup_ui()
         self._apply_styles()
@@ -379,14 +381,9 @@ class ESManagerWidget(QWidget):
         if not profile:
             return
         
-        # 初始化客户端
+        # 获取客户端（同一连接共享，切换回来时复用已有连接）
         try:
-            self.es_client = ESClient(
-                host=profile.get("host", "localhost"),
-                port=profile.get("port", 9200),
-                username=profile.get("username", ""),
-                password=profile.get("password", "")
-            )
+            self.es_client = get_es_client(profile)
             self._refresh_indices()
             self.add_doc_btn.setEnabled(True)
             self.status_label.setText(f"已连接: {profile.get('name', '')}")
@@ -403,18 +400,18 @@ class ESManagerWidget(QWidget):
         
         # 使用 Worker 异步加载
         profile = self.conn_combo.currentData()
-        self.es_worker = ESWorker(profile, parent=self)
+        self.es_worker = self._new_worker(profile)
         self.es_worker.indices_ready.connect(self._on_indices_loaded)
         self.es_worker.error_occurred.connect(self._on_error)
         self.es_worker.list_indices()
         self.es_worker.start()
     
-    def _on_indices_loaded(self, indices: list):
-        """索引列表加载完成"""
+    def _on_indices_loaded(self, indices: dict):
+        """索引列表加载完成（indices 为按列存放的并行列表）"""
         self.all_indices = indices
         self._filter_indices()
         
-        total = len(indices)
+        total = len(indices.get("name", []))
         self.index_stats.setText(f"共 {total} 个索引")
         self.status_label.setText(f"已加载 {total} 个索引")
     
@@ -423,26 +420,29 @@ class ESManagerWidget(QWidget):
         filter_text = self.index_filter.text().lower()
         self.index_list.clear()
         
-        for idx in getattr(self, 'all_indices', []):
-            name = idx.get("name", "")
+        # 健康状态 -> 文字颜色
+        health_colors = {"green": Qt.green, "yellow": Qt.yellow, "red": Qt.red}
+        
+        indices = getattr(self, 'all_indices', {})
+        for name, docs_count, store_size, health in zip(
+            indices.get("name", []),
+            indices.get("docs_count", []),
+            indices.get("store_size", []),
+            indices.get("health", []),
+        ):
             if filter_text in name.lower():
-                item = QListWidgetItem(f"{name}\n  📄 {idx.get('docs_count', 0)} docs | 💾 {idx.get('store_size', '0b')}")
-                item.setData(Qt.UserRole, idx)
-                # 根据健康状态设置颜色
-                health = idx.get("health", "")
-                if health == "green":
-                    item.setForeground(Qt.green)
-                elif health == "yellow":
-                    item.setForeground(Qt.yellow)
-                elif health == "red":
-                    item.setForeground(Qt.red)
+                item = QListWidgetItem(f"{name}\n  📄 {docs_count} docs | 💾 {store_size}")
+                item.setData(Qt.UserRole, name)
+                color = health_colors.get(health)
+                if color is not None:
+                    item.setForeground(color)
                 self.index_list.addItem(item)
     
     def _on_index_selected(self, item: QListWidgetItem):
         """选择索引"""
-        idx_data = item.data(Qt.UserRole)
-        self.current_index = idx_data.get("name", "")
+        self.current_index = item.data(Qt.UserRole)
         self.current_page = 1
+        self._page_cursors = {}
         
         self.current_index_label.setText(f"索引: {self.current_index}")
         self._load_docs()
@@ -455,10 +455,13 @@ class ESManagerWidget(QWidget):
         self.status_label.setText(f"加载文档... 第 {self.current_page} 页")
         
         profile = self.conn_combo.currentData()
-        self.es_worker = ESWorker(profile, parent=self)
+        self.es_worker = self._new_worker(profile)
         self.es_worker.docs_ready.connect(self._on_docs_loaded)
         self.es_worker.error_occurred.connect(self._on_error)
-        self.es_worker.search_docs(self.current_index, self.current_page, self.page_size)
+        self.es_worker.search_docs(
+            self.current_index, self.current_page, self.page_size,
+            self._page_cursors.get(self.current_page)
+        )
         self.es_worker.start()
     
     def _on_docs_loaded(self, result: dict):
@@ -467,6 +470,10 @@ class ESManagerWidget(QWidget):
         docs = hits.get("hits", [])
         total = hits.get("total", {}).get("value", 0)
         
+        # 记录下一页的游标，翻页时用 search_after 代替 from
+        if result.get("next_after") is not None:
+            self._page_cursors[self.current_page + 1] = result["next_after"]
+        
         self.total_docs = total
         self._update_table(docs)
         self._update_pagination()
@@ -586,7 +593,7 @@ class ESManagerWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             profile = self.conn_combo.currentData()
-            self.es_worker = ESWorker(profile, parent=self)
+            self.es_worker = self._new_worker(profile)
             self.es_worker.operation_finished.connect(self._on_operation_finished)
             self.es_worker.error_occurred.connect(self._on_error)
             self.es_worker.update_doc(self.current_index, doc_id, data)
@@ -606,7 +613,7 @@ class ESManagerWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             profile = self.conn_combo.currentData()
-            self.es_worker = ESWorker(profile, parent=self)
+            self.es_worker = self._new_worker(profile)
             self.es_worker.operation_finished.connect(self._on_operation_finished)
             self.es_worker.error_occurred.connect(self._on_error)
             self.es_worker.delete_doc(self.current_index, doc_id)
@@ -626,7 +633,7 @@ class ESManagerWidget(QWidget):
             new_data = dialog.get_result()
             if new_data:
                 profile = self.conn_combo.currentData()
-                self.es_worker = ESWorker(profile, parent=self)
+                self.es_worker = self._new_worker(profile)
                 self.es_worker.operation_finished.connect(self._on_operation_finished)
                 self.es_worker.error_occurred.connect(self._on_error)
                 self.es_worker.create_doc(self.current_index, new_data)
@@ -645,6 +652,39 @@ class ESManagerWidget(QWidget):
         self.status_label.setText(f"错误: {error_msg}")
         self.status_label.setStyleSheet("color: #f48771;")
         QMessageBox.critical(self, "错误", error_msg)
+    
+    def _new_worker(self, profile: dict) -> ESWorker:
+        """
+        创建 ESWorker 并登记，顺带释放已结束的旧任务
+        
+        Args:
+            profile: ES 连接配置
+        """
+        running = []
+        for worker in self._es_workers:
+            if worker.is_running():
+                running.append(worker)
+            else:
+                worker.deleteLater()
+        
+        worker = ESWorker(profile, client=self.es_client, parent=self)
+        running.append(worker)
+        self._es_workers = running
+        return worker
+    
+    def closeEvent(self, event) -> None:
+        """
+        关闭时取消进行中的请求，不阻塞界面（共享客户端在进程退出时关闭）
+        
+        请求无法中断，仍在执行的任务脱离本界面，结束后自行释放。
+        """
+        for worker in self._es_workers:
+            if worker.is_running():
+                worker.cancel()
+                worker.setParent(None)
+        self._es_workers = []
+        self.es_worker = None
+        event.accept()
 
 
 if __name__ == "__main__":
@@ -39,7 +39,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QFont, QKeySequence, QShortcut
 
-from core.managers.connection_manager import ConnectionManager
+from core.managers.connection_manager import get_connection_manager
 from core.workers.sql_worker import SQLWorker
 
 
@@ -68,8 +68,10 @@ class SQLConsoleWidget(QWidget):
         super().__init__(parent)
         
         self.title_text = title
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = get_connection_manager()
         self.sql_worker: SQLWorker = None
+        # 所有尚未结束的执行线程（含已停止或被替换的旧线程），关闭时逐个等待
+        self._live_workers: list = []
         
         self._setup_ui()
         self._apply_styles()
@@ -471,9 +473,12 @@ class SQLConsoleWidget(QWidget):
         # 创建并启动 SQL 执行线程
         self.sql_worker = SQLWorker(profile, sql_text, parent=self)
         self.sql_worker.select_result_signal.connect(self._on_select_result)
+        self.sql_worker.select_chunk_signal.connect(self._on_select_chunk)
         self.sql_worker.execute_result_signal.connect(self._on_execute_result)
         self.sql_worker.error_signal.connect(self._on_error)
-        self.sql_worker.finished_signal.connect(lambda: self._set_executing_state(False))
+        self.sql_worker.finished_signal.connect(self._on_worker_finished)
+        self.sql_worker.finished.connect(self._on_thread_finished)
+        self._live_workers.append(self.sql_worker)
         
         self.sql_worker.start()
     
@@ -481,6 +486,8 @@ class SQLConsoleWidget(QWidget):
         """停止执行"""
         if self.sql_worker and self.sql_worker.is_running():
             self.sql_worker.stop()
+            # 停止后线程可能还会送达已读取的结果，不再显示（线程仍在 _live_workers 中，关闭时等待）
+            self.sql_worker = None
             self.status_label.setText("已停止")
             self._set_executing_state(False)
     
@@ -505,17 +512,17 @@ class SQLConsoleWidget(QWidget):
             headers: 表头列表
             rows: 数据行列表（每行是一个字符串列表）
         """
+        # 已停止或被替换的旧线程仍可能送达结果，忽略
+        if self.sender() is not self.sql_worker:
+            return
+        
         # 设置表格结构
         self.result_table.setColumnCount(len(headers))
         self.result_table.setRowCount(len(rows))
         self.result_table.setHorizontalHeaderLabels(headers)
         
         # 填充数据
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_value in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_value))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # 只读
-                self.result_table.setItem(row_idx, col_idx, item)
+        self._fill_rows(0, rows)
         
         # 调整列宽
         self.result_table.resizeColumnsToContents()
@@ -528,6 +535,50 @@ class SQLConsoleWidget(QWidget):
         
         self.result_label.setText(f"查询结果 (SELECT)")
     
+    def _on_select_chunk(self, headers: list, rows: list) -> None:
+        """
+        处理分批到达的 SELECT 查询结果（追加到表格末尾）
+        
+        Args:
+            headers: 表头列表
+            rows: 本批数据行列表
+        """
+        # 已停止或被替换的旧线程仍可能送达结果，忽略
+        if self.sender() is not self.sql_worker:
+            return
+        
+        start = self.result_table.rowCount()
+        if start == 0:
+            self.result_table.setColumnCount(len(headers))
+            self.result_table.setHorizontalHeaderLabels(headers)
+        
+        self.result_table.setRowCount(start + len(rows))
+        self._fill_rows(start, rows)
+        
+        # 按第一批数据调整列宽
+        if start == 0:
+            self.result_table.resizeColumnsToContents()
+        
+        self.status_label.setText(f"查询成功")
+        self.status_label.setStyleSheet("color: #4ec9b0;")
+        self.rows_label.setText(f"共 {start + len(rows)} 行数据 | {len(headers)} 列")
+        
+        self.result_label.setText(f"查询结果 (SELECT)")
+    
+    def _fill_rows(self, start: int, rows: list) -> None:
+        """
+        从指定行开始填充只读单元格
+        
+        Args:
+            start: 起始行号
+            rows: 数据行列表（每行是一个字符串列表）
+        """
+        for row_idx, row_data in enumerate(rows, start):
+            for col_idx, cell_value in enumerate(row_data):
+                item = QTableWidgetItem(str(cell_value))
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # 只读
+                self.result_table.setItem(row_idx, col_idx, item)
+    
     def _on_execute_result(self, rowcount: int, message: str) -> None:
         """
         处理非查询语句结果
@@ -536,6 +587,10 @@ class SQLConsoleWidget(QWidget):
             rowcount: 影响行数
             message: 消息文本
         """
+        # 已停止或被替换的旧线程仍可能送达结果，忽略
+        if self.sender() is not self.sql_worker:
+            return
+        
         self.status_label.setText(message)
         self.status_label.setStyleSheet("color: #4ec9b0;")
         self.rows_label.setText(f"")
@@ -547,11 +602,29 @@ class SQLConsoleWidget(QWidget):
     
     def _on_error(self, error_msg: str) -> None:
         """处理错误"""
+        # 已停止或被替换的旧线程仍可能送达结果，忽略
+        if self.sender() is not self.sql_worker:
+            return
+        
         self.status_label.setText("执行失败")
         self.status_label.setStyleSheet("color: #f48771;")
         
         QMessageBox.critical(self, "SQL 执行错误", error_msg)
     
+    def _on_worker_finished(self) -> None:
+        """当前执行线程结束"""
+        if self.sender() is not self.sql_worker:
+            return
+        self.sql_worker = None
+        self._set_executing_state(False)
+    
+    def _on_thread_finished(self) -> None:
+        """执行线程退出后移出跟踪列表并释放"""
+        worker = self.sender()
+        if worker in self._live_workers:
+            self._live_workers.remove(worker)
+        worker.deleteLater()
+    
     def _set_executing_state(self, executing: bool) -> None:
         """设置执行状态"""
         self.execute_btn.setEnabled(not executing)
@@ -567,8 +640,11 @@ class SQLConsoleWidget(QWidget):
     
     def closeEvent(self, event) -> None:
         """关闭时确保线程停止"""
-        if self.sql_worker and self.sql_worker.is_running():
-            self.sql_worker.stop()
+        # 子线程在运行中被销毁会导致进程崩溃，先全部通知停止再逐个等待
+        for worker in self._live_workers:
+            worker.stop()
+        for worker in self._live_workers:
+            worker.wait()
         event.accept()
 
 